@@ -9,7 +9,7 @@ from pydantic import BaseModel
 from typing import Optional, List, Dict, Any
 
 from models.schemas import GameState
-from services.deep_research import deep_research_service, StrategyInsight
+from services.deep_research import deep_research_service, StrategyInsight, CoachingTurn
 from services.deep_think_tactics import deep_think_tactics_service, HalftimeTactics
 from utils.logger import logger
 
@@ -46,6 +46,14 @@ class StrategyInsightResponse(BaseModel):
     quarter_context: str
 
 
+class CoachingTurnResponse(BaseModel):
+    """Response with a full coaching turn."""
+
+    strategy: StrategyInsightResponse
+    player_recommendations: List[Dict[str, str]]
+    play_suggestion: Dict[str, Any]
+
+
 class PlayerRecommendation(BaseModel):
     """Single player recommendation."""
 
@@ -148,7 +156,7 @@ async def analyze_strategy(request: DeepResearchQuery) -> StrategyInsightRespons
     - "Which players should we focus on?"
     """
     try:
-        insight = deep_research_service.analyze_strategy(
+        insight = await deep_research_service.analyze_strategy(
             query=request.query,
             game_state=request.game_state,
         )
@@ -173,6 +181,43 @@ async def analyze_strategy(request: DeepResearchQuery) -> StrategyInsightRespons
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/analyze-turn", response_model=CoachingTurnResponse, summary="Get a full coaching turn")
+async def analyze_turn(request: DeepResearchQuery) -> CoachingTurnResponse:
+    """
+    Answer a coaching question with strategy, player recommendations and
+    a next play suggestion from a single model call.
+    """
+    try:
+        turn = await deep_research_service.analyze_turn(
+            query=request.query,
+            game_state=request.game_state,
+        )
+
+        if not turn:
+            raise HTTPException(status_code=500, detail="Failed to generate coaching turn")
+
+        insight = turn.strategy
+        return CoachingTurnResponse(
+            strategy=StrategyInsightResponse(
+                title=insight.title,
+                description=insight.description,
+                confidence=insight.confidence,
+                player_recommendations=insight.player_recommendations,
+                play_types=insight.play_types,
+                reasoning=insight.reasoning,
+                quarter_context=insight.quarter_context,
+            ),
+            player_recommendations=turn.player_recommendations,
+            play_suggestion=turn.play_suggestion,
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Coaching turn failed: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/ask-question", summary="Ask a question about the game")
 async def ask_question(request: DeepResearchQuery) -> Dict[str, str]:
     """
@@ -182,7 +227,7 @@ async def ask_question(request: DeepResearchQuery) -> Dict[str, str]:
     specific, actionable insights.
     """
     try:
-        answer = deep_research_service.answer_question(
+        answer = await deep_research_service.answer_question(
             query=request.query,
             game_state=request.game_state,
         )
@@ -218,7 +263,7 @@ async def get_player_recommendations(
             possession=game_state_possession,
         )
 
-        recommendations = deep_research_service.get_player_recommendations(
+        recommendations = await deep_research_service.get_player_recommendations(
             game_state=game_state,
             focus_team=focus_team or game_state_possession,
         )
@@ -302,7 +347,7 @@ async def generate_halftime_tactics(request: HalftimeTacticsRequest) -> Halftime
     Uses Gemini's deep think capabilities for complex strategic analysis.
     """
     try:
-        tactics = deep_think_tactics_service.generate_halftime_tactics(
+        tactics = await deep_think_tactics_service.generate_halftime_tactics(
             game_state=request.game_state,
             possession_team=request.possession_team,
             defense_team=request.defense_team,
@@ -342,7 +387,7 @@ async def get_next_play_suggestion(request: NextPlaySuggestionRequest) -> Dict[s
     to recommend optimal play type, formation, and key personnel.
     """
     try:
-        suggestion = deep_think_tactics_service.generate_next_play_suggestion(
+        suggestion = await deep_think_tactics_service.generate_next_play_suggestion(
             game_state=request.game_state,
             recent_plays=request.recent_plays,
             possession_team=request.possession_team,
@@ -61,7 +61,7 @@ async def update_score(update: ScoreUpdate):
 
     # Recalculate win probability
     state = state_manager.state
-    win_prob = win_probability_model.calculate_from_game_state(state.model_dump())
+    win_prob = win_probability_model.calculate_from_game_state(state.summary_dict())
     await state_manager.update_play(state.lastPlay, win_prob=win_prob)
 
     return {"status": "updated", "state": state_manager.state}
@@ -74,7 +74,7 @@ async def update_clock(update: ClockUpdate):
 
     # Recalculate win probability
     state = state_manager.state
-    win_prob = win_probability_model.calculate_from_game_state(state.model_dump())
+    win_prob = win_probability_model.calculate_from_game_state(state.summary_dict())
     await state_manager.update_play(state.lastPlay, win_prob=win_prob)
 
     return {"status": "updated", "state": state_manager.state}
@@ -137,7 +137,7 @@ async def get_win_probability():
     Returns win probability for both teams based on current state.
     """
     state = state_manager.state
-    win_prob = win_probability_model.calculate_from_game_state(state.model_dump())
+    win_prob = win_probability_model.calculate_from_game_state(state.summary_dict())
 
     # Adjust for which team has possession
     if state.possession == "KC":
@@ -1,18 +1,27 @@
 """
 Match API Routes - Endpoints for match/session management
 """
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from pydantic import BaseModel
 
 from database.connection import get_db
 from services.match_service import MatchService
+from services.snapshot_writer import snapshot_writer
 from utils.logger import logger
 
 router = APIRouter()
 
 
+def _json_list_response(rows) -> Response:
+    """Build a JSON array response from rows' cached to_json() payloads."""
+    return Response(
+        content=b"[" + b",".join(row.to_json() for row in rows) + b"]",
+        media_type="application/json",
+    )
+
+
 # Request/Response models
 class CreateMatchRequest(BaseModel):
     home_team: str = "KC"
@@ -207,10 +216,10 @@ async def get_current_match_full(
 @router.post("/current/event", response_model=dict)
 async def add_event(request: AddEventRequest, db: Session = Depends(get_db)):
     """Add an analysis event to the current match"""
-    match = MatchService.get_or_create_active_match(db)
+    match_id = MatchService.get_or_create_active_match_id(db)
     event = MatchService.add_analysis_event(
         db=db,
-        match_id=match.id,
+        match_id=match_id,
         timestamp=request.timestamp,
         event_type=request.event,
         details=request.details,
@@ -225,10 +234,10 @@ async def add_event(request: AddEventRequest, db: Session = Depends(get_db)):
 @router.post("/current/highlight", response_model=dict)
 async def add_highlight(request: AddHighlightRequest, db: Session = Depends(get_db)):
     """Add a highlight capture to the current match"""
-    match = MatchService.get_or_create_active_match(db)
+    match_id = MatchService.get_or_create_active_match_id(db)
     highlight = MatchService.add_highlight(
         db=db,
-        match_id=match.id,
+        match_id=match_id,
         timestamp=request.timestamp,
         event_type=request.event,
         description=request.description,
@@ -249,24 +258,24 @@ async def get_events(
     db: Session = Depends(get_db)
 ):
     """Get events for current match"""
-    match = MatchService.get_or_create_active_match(db)
-    events = MatchService.get_match_events(db, match.id, limit=limit, offset=offset)
-    return [e.to_dict() for e in events]
+    match_id = MatchService.get_or_create_active_match_id(db)
+    events = MatchService.get_match_events(db, match_id, limit=limit, offset=offset)
+    return _json_list_response(events)
 
 
 @router.get("/current/highlights", response_model=List[dict])
 async def get_highlights(db: Session = Depends(get_db)):
     """Get highlights for current match"""
-    match = MatchService.get_or_create_active_match(db)
-    highlights = MatchService.get_match_highlights(db, match.id)
+    match_id = MatchService.get_or_create_active_match_id(db)
+    highlights = MatchService.get_match_highlights(db, match_id)
     return [h.to_dict() for h in highlights]
 
 
 @router.get("/current/metrics", response_model=dict)
 async def get_metrics(db: Session = Depends(get_db)):
     """Get metrics for current match"""
-    match = MatchService.get_or_create_active_match(db)
-    metrics = MatchService.get_match_metrics(db, match.id)
+    match_id = MatchService.get_or_create_active_match_id(db)
+    metrics = MatchService.get_match_metrics(db, match_id)
     if metrics:
         return metrics.to_dict()
     return {}
@@ -285,7 +294,7 @@ async def end_match(match_id: str, db: Session = Depends(get_db)):
 async def get_match_history(limit: int = 20, db: Session = Depends(get_db)):
     """Get match history"""
     matches = MatchService.get_all_matches(db, limit=limit)
-    return [m.to_dict() for m in matches]
+    return _json_list_response(matches)
 
 
 @router.get("/{match_id}", response_model=dict)
@@ -369,12 +378,11 @@ async def save_simulation_snapshot(
 ):
     """Save a simulation state snapshot"""
     # Verify match exists
-    match = MatchService.get_match(db, match_id)
-    if not match:
+    if not MatchService.match_exists(db, match_id):
         raise HTTPException(status_code=404, detail="Match not found")
 
-    snapshot = MatchService.save_simulation_snapshot(
-        db=db,
+    # Snapshots arrive every play cycle; queue them for a batched write
+    snapshot = snapshot_writer.enqueue(
         match_id=match_id,
         timestamp=request.timestamp,
         play_cycle=request.play_cycle,
@@ -406,9 +414,8 @@ async def get_simulation_snapshots(
 ):
     """Get all simulation snapshots for a match"""
     # Verify match exists
-    match = MatchService.get_match(db, match_id)
-    if not match:
+    if not MatchService.match_exists(db, match_id):
         raise HTTPException(status_code=404, detail="Match not found")
 
     snapshots = MatchService.get_simulation_snapshots(db, match_id, limit=limit)
-    return [s.to_dict() for s in snapshots]
+    return _json_list_response(snapshots)
@@ -102,13 +102,15 @@ async def analyze_frame(request: FrameAnalysisRequest):
         # Decode base64 image
         image_data = base64.b64decode(request.image)
         image = Image.open(io.BytesIO(image_data))
+        logger.info(f"Analyzing frame: {image.size[0]}x{image.size[1]}")
 
-        # Convert to RGB if necessary
-        if image.mode != 'RGB':
+        if image.format == "JPEG" and image.mode == "RGB":
+            # Already JPEG: forward the uploaded bytes without re-encoding
+            image = image_data
+        elif image.mode != 'RGB':
+            # Convert to RGB if necessary
             image = image.convert('RGB')
 
-        logger.info(f"Analyzing frame: {image.size[0]}x{image.size[1]}")
-
         # Ensure vision agent is initialized
         if not vision_agent._initialized:
             await vision_agent.initialize()
@@ -24,6 +24,9 @@ class Settings:
     ANALYSIS_FPS: int = int(os.getenv("ANALYSIS_FPS", "5"))
     CONFIDENCE_THRESHOLD: float = float(os.getenv("CONFIDENCE_THRESHOLD", "0.5"))
 
+    # Maximum in-flight Gemini requests per service (keeps us under QPM limits)
+    GEMINI_MAX_CONCURRENCY: int = int(os.getenv("GEMINI_MAX_CONCURRENCY", "4"))
+
     # Allowed origins for CORS
     ALLOWED_ORIGINS: list[str] = [
         "http://localhost:5173",
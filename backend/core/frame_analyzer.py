@@ -1,9 +1,8 @@
-from PIL import Image
 from typing import Optional
-import asyncio
 
 from models.schemas import AnalysisResult
 from services.llm_service import llm_service
+from utils.image_parts import ImageInput
 from analytics.play_classifier import play_classifier, PlayType
 from config import settings
 from utils.logger import logger
@@ -17,7 +16,7 @@ class FrameAnalyzer:
 
     async def analyze(
         self,
-        frame: Image.Image,
+        frame: ImageInput,
         frame_number: int,
         fps: float,
         total_frames: int,
@@ -26,7 +25,7 @@ class FrameAnalyzer:
         Analyze a single frame for football events.
 
         Args:
-            frame: PIL Image of the frame
+            frame: Frame as PIL Image or JPEG bytes
             frame_number: Frame number in sequence
             fps: Video frames per second
             total_frames: Total frames in video
@@ -34,15 +33,21 @@ class FrameAnalyzer:
         Returns:
             List of detected events
         """
-        # Calculate timestamp
-        timestamp_seconds = frame_number / fps
-        minutes = int(timestamp_seconds // 60)
-        seconds = int(timestamp_seconds % 60)
-        timestamp = f"{minutes}:{seconds:02d}"
+        timestamp = self._format_timestamp(frame_number, fps)
 
         # Use LLM service for analysis
         events = await llm_service.analyze_frame(frame, timestamp)
+        return self._process_events(events)
+
+    def _format_timestamp(self, frame_number: int, fps: float) -> str:
+        """Convert a frame number to an M:SS timestamp."""
+        timestamp_seconds = frame_number / fps
+        minutes = int(timestamp_seconds // 60)
+        seconds = int(timestamp_seconds % 60)
+        return f"{minutes}:{seconds:02d}"
 
+    def _process_events(self, events: list[AnalysisResult]) -> list[AnalysisResult]:
+        """Classify events and drop repeats of the previous frame's events."""
         # Classify and enrich events
         for event in events:
             play_type = play_classifier.classify(f"{event.event} {event.details}")
@@ -87,12 +92,12 @@ class FrameAnalyzer:
 
     async def analyze_batch(
         self,
-        frames: list[tuple[Image.Image, int]],
+        frames: list[tuple[ImageInput, int]],
         fps: float,
         total_frames: int,
     ) -> list[AnalysisResult]:
         """
-        Analyze multiple frames concurrently.
+        Analyze multiple frames with one LLM request.
 
         Args:
             frames: List of (frame, frame_number) tuples
@@ -102,12 +107,11 @@ class FrameAnalyzer:
         Returns:
             Combined list of events
         """
-        tasks = [
-            self.analyze(frame, frame_num, fps, total_frames)
+        batch_events = await llm_service.analyze_frames_batch([
+            (frame, self._format_timestamp(frame_num, fps))
             for frame, frame_num in frames
-        ]
-
-        results = await asyncio.gather(*tasks)
+        ])
+        results = [self._process_events(events) for events in batch_events]
 
         # Flatten and deduplicate
         all_events = []
@@ -2,12 +2,13 @@ import cv2
 import numpy as np
 from PIL import Image
 from pathlib import Path
-from typing import Generator, Optional
+from typing import Generator, Optional, Union
 import asyncio
 
 from models.schemas import AnalysisResult, FrameAnalysis
 from core.frame_analyzer import FrameAnalyzer
 from config import settings
+from utils.image_parts import encode_jpeg_bgr
 from utils.logger import logger
 
 
@@ -27,12 +28,15 @@ class VideoProcessor:
     def extract_frames(
         self,
         video_path: str,
-    ) -> Generator[tuple[Image.Image, int, float], None, None]:
+        as_jpeg: bool = False,
+    ) -> Generator[tuple[Union[Image.Image, bytes], int, float], None, None]:
         """
         Extract frames from video at specified FPS.
 
         Args:
             video_path: Path to video file
+            as_jpeg: Yield JPEG bytes encoded straight from the decoded frame
+                instead of PIL Images
 
         Yields:
             Tuple of (PIL Image, frame_number, timestamp_seconds)
@@ -65,12 +69,15 @@ class VideoProcessor:
                 break
 
             if frame_count % frame_interval == 0:
-                # Convert BGR to RGB
-                rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                pil_image = Image.fromarray(rgb_frame)
+                if as_jpeg:
+                    image = encode_jpeg_bgr(frame)
+                else:
+                    # Convert BGR to RGB
+                    rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+                    image = Image.fromarray(rgb_frame)
 
                 timestamp_seconds = frame_count / video_fps
-                yield pil_image, frame_count, timestamp_seconds
+                yield image, frame_count, timestamp_seconds
                 extracted_count += 1
 
             frame_count += 1
@@ -103,10 +110,11 @@ class VideoProcessor:
         all_results: list[AnalysisResult] = []
         batch_size = 3  # Process 3 frames at a time
 
-        frames_batch: list[tuple[Image.Image, int]] = []
+        frames_batch: list[tuple[bytes, int]] = []
 
-        for pil_image, frame_num, _ in self.extract_frames(str(path)):
-            frames_batch.append((pil_image, frame_num))
+        # Encode each frame to JPEG once; the bytes go to Gemini as-is
+        for jpeg_bytes, frame_num, _ in self.extract_frames(str(path), as_jpeg=True):
+            frames_batch.append((jpeg_bytes, frame_num))
 
             if len(frames_batch) >= batch_size:
                 batch_results = await self.frame_analyzer.analyze_batch(
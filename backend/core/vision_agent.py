@@ -18,6 +18,7 @@ from config import settings
 from models.schemas import AnalysisResult, GameState
 from services.state_manager import state_manager
 from analytics.play_classifier import play_classifier, PlayType
+from utils.image_parts import ImageInput, encode_jpeg_bgr, jpeg_part
 from utils.logger import logger
 
 # Try to import vision-agents components
@@ -157,9 +158,8 @@ Separate multiple events with ---"""
         # Fallback: Initialize direct Gemini API
         if settings.GEMINI_API_KEY:
             try:
-                import google.generativeai as genai
-                genai.configure(api_key=settings.GEMINI_API_KEY)
-                self._gemini_model = genai.GenerativeModel("gemini-2.5-flash")
+                from services import gemini_pool
+                self._gemini_model = gemini_pool.get_model("gemini-2.5-flash")
                 self._initialized = True
                 logger.info("Vision Agent initialized with gemini-2.5-flash")
                 return True
@@ -256,14 +256,14 @@ Separate multiple events with ---"""
         seconds = int(timestamp % 60)
         ts_str = f"{minutes}:{seconds:02d}"
 
+        # If we have direct Gemini model, send it JPEG bytes encoded once
+        if self._gemini_model:
+            return await self._analyze_with_gemini(encode_jpeg_bgr(frame), ts_str)
+
         # Convert BGR to RGB and then to PIL Image
         rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
         pil_image = Image.fromarray(rgb_frame)
 
-        # If we have direct Gemini model, use it
-        if self._gemini_model:
-            return await self._analyze_with_gemini(pil_image, ts_str)
-
         # If vision-agents is available and agent is set up
         if self._agent and VISION_AGENTS_AVAILABLE:
             return await self._analyze_with_vision_agents(pil_image, ts_str)
@@ -271,12 +271,15 @@ Separate multiple events with ---"""
         # Fallback demo response
         return self._generate_demo_analysis(ts_str)
 
-    async def _analyze_with_gemini(self, image: Image.Image, timestamp: str) -> list[AnalysisResult]:
+    async def _analyze_with_gemini(self, image: ImageInput, timestamp: str) -> list[AnalysisResult]:
         """Analyze frame using direct Gemini Vision API with retry logic."""
         return await self._analyze_with_retry(image, timestamp)
 
-    async def _analyze_with_retry(self, image: Image.Image, timestamp: str, max_retries: int = 2) -> list[AnalysisResult]:
+    async def _analyze_with_retry(self, image: ImageInput, timestamp: str, max_retries: int = 2) -> list[AnalysisResult]:
         """Analyze frame with retry logic for transient errors."""
+        # Encode once so retries resend the same bytes
+        image_part = jpeg_part(image)
+
         prompt = f"""Analyze this football game frame at timestamp {timestamp}.
 
 {self.SYSTEM_INSTRUCTIONS}
@@ -287,7 +290,7 @@ Respond with detected events in the specified format."""
             try:
                 logger.info(f"Starting Gemini analysis for frame at {timestamp} (attempt {attempt + 1})")
                 response = self._gemini_model.generate_content(
-                    [prompt, image],
+                    [prompt, image_part],
                     request_options={'timeout': 30}
                 )
                 logger.info(f"Gemini analysis successful at {timestamp}")
@@ -3,17 +3,52 @@ SQLAlchemy Database Models for Super Bowl Analytics
 """
 from sqlalchemy import (
     Column, Integer, String, Float, DateTime, Text, Boolean,
-    ForeignKey, JSON, Enum as SQLEnum
+    ForeignKey, JSON, CheckConstraint, Index
 )
-from sqlalchemy.orm import relationship
+from sqlalchemy import event
+from sqlalchemy.orm import relationship, reconstructor
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
+import json
 import uuid
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .connection import Base
 
 
+def _dumps(payload) -> bytes:
+    """Serialize a to_dict() payload to JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode()
+
+
+class CachedJSONMixin:
+    """
+    Caches the serialized to_dict() payload on the instance.
+
+    The cache is dropped whenever a column or collection changes, or the
+    instance is expired/refreshed by the session.
+    """
+
+    _cached_json = None
+
+    @reconstructor
+    def _init_json_cache(self):
+        self._cached_json = None
+
+    def to_json(self) -> bytes:
+        """Return to_dict() as JSON bytes, reusing the cached copy if clean."""
+        if self._cached_json is None:
+            self._cached_json = _dumps(self.to_dict())
+        return self._cached_json
+
+
 class MatchStatus(enum.Enum):
     """Match status enum"""
     ACTIVE = "active"
@@ -21,12 +56,18 @@ class MatchStatus(enum.Enum):
     COMPLETED = "completed"
 
 
-class Match(Base):
+class Match(CachedJSONMixin, Base):
     """
     Represents a live analysis session/match.
     Each time user starts analysis, a new match is created.
     """
     __tablename__ = "matches"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN ('active', 'paused', 'completed')",
+            name="ck_matches_status",
+        ),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -45,8 +86,8 @@ class Match(Base):
     down = Column(Integer, default=1)
     distance = Column(Integer, default=10)
 
-    # Status
-    status = Column(SQLEnum(MatchStatus), default=MatchStatus.ACTIVE)
+    # Status (plain string, one of MatchStatus values)
+    status = Column(String(16), default=MatchStatus.ACTIVE.value)
 
     # Relationships
     events = relationship("AnalysisEvent", back_populates="match", cascade="all, delete-orphan")
@@ -66,13 +107,13 @@ class Match(Base):
             "possession": self.possession,
             "down": self.down,
             "distance": self.distance,
-            "status": self.status.value if self.status else None,
+            "status": self.status,
             "event_count": len(self.events) if self.events else 0,
             "highlight_count": len(self.highlights) if self.highlights else 0,
         }
 
 
-class AnalysisEvent(Base):
+class AnalysisEvent(CachedJSONMixin, Base):
     """
     Stores individual analysis events detected during the match.
     """
@@ -128,7 +169,7 @@ class AnalysisEvent(Base):
         }
 
 
-class MatchHighlight(Base):
+class MatchHighlight(CachedJSONMixin, Base):
     """
     Stores captured highlight moments with images.
     """
@@ -164,7 +205,7 @@ class MatchHighlight(Base):
         }
 
 
-class SimulationSnapshot(Base):
+class SimulationSnapshot(CachedJSONMixin, Base):
     """
     Stores snapshots of simulation state captured during live simulations.
     """
@@ -223,7 +264,7 @@ class SimulationSnapshot(Base):
         }
 
 
-class MatchMetrics(Base):
+class MatchMetrics(CachedJSONMixin, Base):
     """
     Aggregated metrics for a match, updated as events come in.
     """
@@ -266,8 +307,8 @@ class MatchMetrics(Base):
     max_player_speed = Column(Float, default=21.2)
     route_efficiency = Column(Float, default=75.0)
 
-    # Formations detected (JSON array)
-    formations_detected = Column(JSON, default=list)
+    # Formations detected (JSON object: formation name -> count)
+    formations_detected = Column(JSON, default=dict)
 
     # Relationship
     match = relationship("Match", back_populates="metrics")
@@ -299,5 +340,49 @@ class MatchMetrics(Base):
             "avgPlayerSpeed": self.avg_player_speed,
             "maxPlayerSpeed": self.max_player_speed,
             "routeEfficiency": self.route_efficiency,
-            "formations": self.formations_detected or [],
+            "formations": self._formations_list(),
         }
+
+    def _formations_list(self):
+        """Formation counts as [{"name", "count"}], most frequent first"""
+        formations = self.formations_detected or {}
+        if isinstance(formations, list):
+            # Rows written before counts were stored as an object
+            return formations
+        return [
+            {"name": name, "count": count}
+            for name, count in sorted(formations.items(), key=lambda item: -item[1])
+        ]
+
+
+# Composite indexes for the per-match listing queries (filter by match_id,
+# order by created_at) and for get_active_match (filter by status, newest first)
+Index("ix_matches_status_created", Match.status, Match.created_at.desc())
+Index("ix_analysis_events_match_created", AnalysisEvent.match_id, AnalysisEvent.created_at.desc())
+Index("ix_match_highlights_match_created", MatchHighlight.match_id, MatchHighlight.created_at.desc())
+Index("ix_simulation_snapshots_match_created", SimulationSnapshot.match_id, SimulationSnapshot.created_at)
+
+
+def _invalidate_json_cache(target, *args):
+    # Expiring a parent can drop the last reference to a child instance
+    # before its own expire event fires
+    if target is not None:
+        target._cached_json = None
+
+
+def _register_json_cache_listeners(model, collections=()):
+    for column in model.__table__.columns:
+        event.listen(getattr(model, column.key), "set", _invalidate_json_cache)
+    for name in collections:
+        attr = getattr(model, name)
+        event.listen(attr, "append", _invalidate_json_cache)
+        event.listen(attr, "remove", _invalidate_json_cache)
+    event.listen(model, "expire", _invalidate_json_cache)
+    event.listen(model, "refresh", _invalidate_json_cache)
+
+
+_register_json_cache_listeners(Match, collections=("events", "highlights"))
+_register_json_cache_listeners(AnalysisEvent)
+_register_json_cache_listeners(MatchHighlight)
+_register_json_cache_listeners(SimulationSnapshot)
+_register_json_cache_listeners(MatchMetrics)
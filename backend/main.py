@@ -16,11 +16,14 @@ from api.routes.match import router as match_router
 from api.routes.deep_research import router as deep_research_router
 from core.vision_agent import vision_agent, VISION_AGENTS_AVAILABLE
 from core.football_agent import football_agent, VISION_AGENTS_AVAILABLE as STREAM_AVAILABLE
+from services.state_manager import state_manager
+from services.veo_service import veo_service
 from utils.logger import logger
 
 # Database imports
 try:
     from database.connection import init_db
+    from services.snapshot_writer import snapshot_writer
     DATABASE_AVAILABLE = True
 except ImportError:
     DATABASE_AVAILABLE = False
@@ -37,6 +40,7 @@ async def lifespan(app: FastAPI):
     if DATABASE_AVAILABLE:
         try:
             init_db()
+            snapshot_writer.start()
             logger.info("PostgreSQL database initialized")
         except Exception as e:
             logger.error(f"Database initialization failed: {e}")
@@ -80,6 +84,12 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down Super Bowl Analytics Backend...")
 
+    await state_manager.stop()
+    await veo_service.aclose()
+
+    if DATABASE_AVAILABLE:
+        await snapshot_writer.stop()
+
 
 # Create FastAPI application
 app = FastAPI(
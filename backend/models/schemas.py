@@ -1,4 +1,5 @@
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Literal, Optional, Dict, Any, Union
 
 
@@ -72,12 +73,16 @@ class Player(BaseModel):
 class ScoreState(BaseModel):
     """Current score."""
 
+    model_config = ConfigDict(frozen=True)
+
     home: int = 0
     away: int = 0
 
 
 class GameState(BaseModel):
-    """Current state of the game."""
+    """Current state of the game (immutable; update with model_copy)."""
+
+    model_config = ConfigDict(frozen=True)
 
     clock: str = "15:00"
     quarter: int = Field(1, ge=1, le=4)
@@ -93,6 +98,39 @@ class GameState(BaseModel):
     defensiveStopRate: float = 50.0
     engagement: str = "0"
 
+    def summary_key(self) -> tuple:
+        """Hashable signature of the fields used in context summaries."""
+        return (
+            self.quarter,
+            self.clock,
+            self.score.home,
+            self.score.away,
+            self.down,
+            self.distance,
+            self.possession,
+        )
+
+    def summary_dict(self) -> Dict[str, Any]:
+        """
+        Summary fields as a plain dict, shared per summary_key().
+
+        Cheaper than model_dump() for read-only consumers; do not mutate.
+        """
+        return _summary_dict(self.summary_key())
+
+
+@lru_cache(maxsize=128)
+def _summary_dict(key: tuple) -> Dict[str, Any]:
+    quarter, clock, home, away, down, distance, possession = key
+    return {
+        "quarter": quarter,
+        "clock": clock,
+        "score": {"home": home, "away": away},
+        "down": down,
+        "distance": distance,
+        "possession": possession,
+    }
+
 
 class LiveStatsResponse(BaseModel):
     """Response for live stats endpoint."""
@@ -5,18 +5,110 @@ Provides RAG-based deep research on live match data.
 Generates strategy insights, player recommendations, and tactical analysis.
 """
 
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
-import json
+import asyncio
+import hashlib
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Optional, Dict, Any, List, AsyncIterator, Deque
 import re
+import threading
+import zlib
 
 import google.generativeai as genai
 
 from config import settings
 from models.schemas import GameState, AnalysisResult
+from services import gemini_pool
 from services.rag_context_store import RAGContextStore, ContextImportance
+from services import llm_semantic_cache
+from services.llm_semantic_cache import SemanticLLMCache
+from utils.json_extract import extract_json_object, loads_json
 from utils.logger import logger
 
+# Pattern: PLAYER: [name] | POSITION: [pos] | ACTION: [action]
+_PLAYER_RE = re.compile(
+    r'PLAYER:\s*([^|]+)\s*\|\s*POSITION:\s*([^|]+)\s*\|\s*ACTION:\s*([^|]+)',
+    re.IGNORECASE,
+)
+_CONFIDENCE_RE = re.compile(r'confidence[:\s]+(\d+)%?', re.IGNORECASE)
+
+# Event type substrings mapped to context importance, checked in priority order
+_IMPORTANCE_PATTERNS = (
+    (re.compile(r'turnover|interception|fumble|sack|scoring|touchdown|field_goal', re.IGNORECASE),
+     ContextImportance.CRITICAL),
+    (re.compile(r'formation_change|explosive_play', re.IGNORECASE), ContextImportance.HIGH),
+    (re.compile(r'pass|run', re.IGNORECASE), ContextImportance.MEDIUM),
+    (re.compile(r'tackle', re.IGNORECASE), ContextImportance.LOW),
+)
+
+_ANALYST_SYSTEM_PROMPT = """You are an expert NFL tactical analyst with deep knowledge of:
+- Offensive and defensive strategies
+- Player positioning and roles
+- Game situation analysis
+- Play calling and formation selection
+- Opponent weakness exploitation
+
+Provide insightful, actionable recommendations backed by specific plays, formations, and player assignments."""
+
+# Static prompt sections, built once; only the game-specific fields are
+# formatted per call.
+_ANALYSIS_INSTRUCTIONS = """
+ANALYSIS NEEDED:
+1. Identify opponent weaknesses from recent plays
+2. Suggest specific formations and plays to exploit
+3. Recommend key players to involve
+4. Explain the tactical reasoning
+5. Provide confidence level (0-100%)
+6. Suggest the next play to call
+
+OUTPUT:
+Respond with a single valid JSON document with this structure:
+{
+  "strategy": {
+    "title": "short headline",
+    "description": "the recommendation in 1-2 sentences",
+    "confidence": 75,
+    "play_types": ["play action", "screen pass"],
+    "reasoning": "tactical reasoning with specific player names"
+  },
+  "player_recommendations": [
+    {"name": "player name", "position": "QB/WR/RB/etc", "action": "what they should do"}
+  ],
+  "play_suggestion": {
+    "play_type": "pass/run/screen/trick",
+    "formation": "formation name",
+    "key_personnel": ["QB", "WR"],
+    "success_probability": 0.65,
+    "reasoning": "why this play"
+  }
+}"""
+
+_QUESTION_INSTRUCTIONS = """INSTRUCTIONS:
+- Be concise but detailed
+- Reference specific plays or formations from the recent context
+- Provide tactical reasoning
+- Suggest specific player names when relevant
+- Include confidence levels for key claims"""
+
+_PLAYER_INSTRUCTIONS = """
+TASK: Provide 3-5 specific player recommendations with their positions and suggested actions.
+Format each as: PLAYER: [name] | POSITION: [QB/WR/RB/etc] | ACTION: [what they should do]
+
+Be specific and actionable."""
+
+# Newest history messages kept uncompressed
+_HISTORY_VERBATIM = 2
+# Longest reasoning text kept on a StrategyInsight
+_MAX_REASONING_CHARS = 2000
+
+# Play types recognized in free-text strategy responses (lowercase)
+_PLAY_KEYWORDS = ("power running", "spread", "screen pass", "deep ball", "short slant", "play action")
+
+
+def _prompt_key(prompt: str) -> bytes:
+    """Key identifying identical prompts among in-flight Gemini requests."""
+    return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
 
 @dataclass
 class StrategyInsight:
@@ -31,6 +123,15 @@ class StrategyInsight:
     quarter_context: str               # Quarter/time context
 
 
+@dataclass
+class CoachingTurn:
+    """Strategy, player recommendations and next play from one coaching turn."""
+
+    strategy: StrategyInsight
+    player_recommendations: List[Dict[str, str]]
+    play_suggestion: Dict[str, Any]     # play_type, formation, key_personnel, ...
+
+
 class DeepResearchService:
     """
     Service for deep research on live match data.
@@ -44,8 +145,12 @@ class DeepResearchService:
         self.context_store = RAGContextStore(max_items=500)
         self.model = None
         self._initialized = False
-        self.conversation_history: List[Dict[str, str]] = []
         self.max_history = 10
+        self.conversation_history: Deque[Dict[str, Any]] = deque(maxlen=self.max_history)
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+        self.response_cache = SemanticLLMCache(threshold=0.9, ttl=300, maxsize=512)
+        # Prompt hash -> future of the Gemini call currently serving it
+        self._inflight: Dict[bytes, asyncio.Future] = {}
 
     def initialize(self) -> bool:
         """Initialize Gemini model."""
@@ -57,15 +162,115 @@ class DeepResearchService:
             return False
 
         try:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel("gemini-2.5-flash")
+            self.model = gemini_pool.get_model("gemini-2.5-flash")
             self._initialized = True
+            threading.Thread(target=self._warmup, name="deep-research-warmup", daemon=True).start()
             logger.info("Deep research service initialized")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize deep research: {e}")
             return False
 
+    def _warmup(self) -> None:
+        """Pay first-call costs (embedder load, Gemini channel) off the request path."""
+        try:
+            llm_semantic_cache.warmup()
+            self.model.generate_content(
+                "ping",
+                generation_config=genai.types.GenerationConfig(max_output_tokens=1),
+            )
+            logger.debug("Deep research warmup complete")
+        except Exception as e:
+            logger.warning(f"Deep research warmup failed: {e}")
+
+    def _cache_bucket(self, kind: str, game_state: GameState, *extra) -> tuple:
+        """Response cache partition for a request kind in the current game context."""
+        return (kind, game_state.summary_key(), self.context_store.version, *extra)
+
+    async def _generate(
+        self,
+        prompt: str,
+        cache_bucket: Optional[tuple] = None,
+        cache_query: Optional[str] = None,
+    ) -> str:
+        """
+        Send a prompt to Gemini, bounded by the concurrency limit.
+
+        When cache_bucket is given, the same prompt (or, with a sentence
+        encoder, a paraphrase of cache_query) answered in that bucket is
+        served from the response cache instead. Concurrent calls with an
+        identical prompt share one Gemini request.
+        """
+        if cache_bucket is not None:
+            cached = self.response_cache.get(prompt, cache_bucket, cache_query)
+            if cached is not None:
+                return cached
+
+        key = _prompt_key(prompt)
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # A cancelled leader (e.g. its client disconnected) must not
+                # cancel the callers sharing its request: retry, becoming the
+                # leader. Re-raise if this call itself was cancelled.
+                if not inflight.cancelled():
+                    raise
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            async with self._semaphore:
+                response = await self.model.generate_content_async(prompt)
+            text = response.text
+            future.set_result(text)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        if cache_bucket is not None:
+            self.response_cache.put(prompt, text, cache_bucket, cache_query)
+        return text
+
+    def _remember(self, user_message: str, response_text: str) -> None:
+        """
+        Append an exchange to the (bounded) conversation history.
+
+        Only the newest messages are kept as text; older ones are stored
+        zlib-compressed and inflated by get_conversation_history().
+        """
+        history = self.conversation_history
+        history.append({"role": "user", "content": user_message})
+        history.append({"role": "assistant", "content": response_text})
+
+        for i in range(len(history) - _HISTORY_VERBATIM):
+            message = history[i]
+            if isinstance(message["content"], str):
+                history[i] = {
+                    "role": message["role"],
+                    "content": zlib.compress(message["content"].encode(), 1),
+                }
+
+    def get_conversation_history(self) -> List[Dict[str, str]]:
+        """Get the conversation history with all messages as text."""
+        return [
+            {
+                "role": message["role"],
+                "content": (
+                    zlib.decompress(message["content"]).decode()
+                    if isinstance(message["content"], bytes)
+                    else message["content"]
+                ),
+            }
+            for message in self.conversation_history
+        ]
+
     def add_live_event(
         self,
         event_type: str,
@@ -86,25 +291,10 @@ class DeepResearchService:
             player_name: Player involved
             details: Additional event details
         """
-        # Determine importance based on event type
-        importance_map = {
-            "turnover": ContextImportance.CRITICAL,
-            "interception": ContextImportance.CRITICAL,
-            "fumble": ContextImportance.CRITICAL,
-            "sack": ContextImportance.CRITICAL,
-            "scoring": ContextImportance.CRITICAL,
-            "touchdown": ContextImportance.CRITICAL,
-            "field_goal": ContextImportance.CRITICAL,
-            "formation_change": ContextImportance.HIGH,
-            "explosive_play": ContextImportance.HIGH,
-            "pass": ContextImportance.MEDIUM,
-            "run": ContextImportance.MEDIUM,
-            "tackle": ContextImportance.LOW,
-        }
-
+        # Determine importance based on event type (first matching tier wins)
         importance = ContextImportance.MEDIUM
-        for key, level in importance_map.items():
-            if key.lower() in event_type.lower():
+        for pattern, level in _IMPORTANCE_PATTERNS:
+            if pattern.search(event_type):
                 importance = level
                 break
 
@@ -118,20 +308,24 @@ class DeepResearchService:
             details=details,
         )
 
-    def analyze_strategy(
+    async def analyze_turn(
         self,
         query: str,
         game_state: GameState,
-    ) -> Optional[StrategyInsight]:
+    ) -> Optional[CoachingTurn]:
         """
-        Analyze current strategy based on query and game state.
+        Run a full coaching turn with a single Gemini call.
+
+        One prompt asks for the strategy insight, player recommendations and
+        next play suggestion together as a JSON document, which is then split
+        back into its parts.
 
         Args:
             query: User question about strategy
             game_state: Current game state
 
         Returns:
-            Strategy insight or None if analysis fails
+            Coaching turn or None if analysis fails
         """
         if not self._initialized and not self.initialize():
             logger.warning("Deep research not initialized")
@@ -139,57 +333,123 @@ class DeepResearchService:
 
         try:
             # Retrieve ranked context
-            context_items = self.context_store.retrieve_ranked_context(
+            context_items = self.context_store.retrieve_ranked_context_cached(
                 query=query,
                 top_k=15,
             )
 
             # Build context summary
-            context_summary = self.context_store.get_context_summary(
-                game_state=game_state.dict()
+            context_summary = self.context_store.get_state_summary(game_state.summary_key())
+
+            user_message = self._build_analysis_prompt(query, context_summary, game_state)
+
+            # Generate response
+            response_text = await self._generate(
+                f"{_ANALYST_SYSTEM_PROMPT}\n\n{user_message}",
+                cache_bucket=self._cache_bucket("turn", game_state),
+                cache_query=query,
             )
 
-            # Build prompt with context
-            system_prompt = """You are an expert NFL tactical analyst with deep knowledge of:
-- Offensive and defensive strategies
-- Player positioning and roles
-- Game situation analysis
-- Play calling and formation selection
-- Opponent weakness exploitation
+            self._remember(user_message, response_text)
 
-Provide insightful, actionable recommendations backed by specific plays, formations, and player assignments."""
+            # Split response into its structured parts
+            return self._parse_turn_response(response_text, query, game_state)
 
-            user_message = self._build_analysis_prompt(query, context_summary, game_state)
+        except Exception as e:
+            logger.error(f"Strategy analysis failed: {e}")
+            return None
 
-            # Add to conversation history
-            self.conversation_history.append({"role": "user", "content": user_message})
+    async def analyze_strategy(
+        self,
+        query: str,
+        game_state: GameState,
+    ) -> Optional[StrategyInsight]:
+        """
+        Analyze current strategy based on query and game state.
 
-            # Generate response
-            response = self.model.generate_content(
-                f"{system_prompt}\n\n{user_message}"
-            )
+        Args:
+            query: User question about strategy
+            game_state: Current game state
 
-            # Add to conversation history
-            self.conversation_history.append({"role": "assistant", "content": response.text})
+        Returns:
+            Strategy insight or None if analysis fails
+        """
+        turn = await self.analyze_turn(query, game_state)
+        return turn.strategy if turn else None
 
-            # Trim history
-            if len(self.conversation_history) > self.max_history:
-                self.conversation_history = self.conversation_history[-self.max_history:]
+    async def analyze_strategy_stream(
+        self,
+        query: str,
+        game_state: GameState,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream a strategy analysis as Gemini generates it.
 
-            # Parse response into structured insight
-            insight = self._parse_strategy_response(
-                response.text,
-                query,
-                game_state
-            )
+        Yields {"type": "chunk", "text": ...} messages as text arrives, then a
+        final {"type": "strategy", "strategy": ...} message once the full
+        response has been parsed (or {"type": "error", ...} on failure).
 
-            return insight
+        A concurrency slot is held only while the request is started, not
+        while chunks are consumed. When the same prompt is already in
+        flight, its answer is awaited and yielded as a single chunk.
+
+        Args:
+            query: User question about strategy
+            game_state: Current game state
+        """
+        if not self._initialized and not self.initialize():
+            yield {"type": "error", "message": "Deep research service not available."}
+            return
+
+        try:
+            context_summary = self.context_store.get_state_summary(game_state.summary_key())
+            user_message = self._build_analysis_prompt(query, context_summary, game_state)
+            cache_bucket = self._cache_bucket("turn", game_state)
+            prompt = f"{_ANALYST_SYSTEM_PROMPT}\n\n{user_message}"
+
+            key = _prompt_key(prompt)
+            response_text = self.response_cache.get(prompt, cache_bucket, query)
+            if response_text is None and key in self._inflight:
+                response_text = await self._generate(prompt, cache_bucket, query)
+            if response_text is not None:
+                yield {"type": "chunk", "text": response_text}
+            else:
+                # Lead the request so identical _generate() calls share it
+                future = asyncio.get_running_loop().create_future()
+                self._inflight[key] = future
+                try:
+                    chunks: List[str] = []
+                    async with self._semaphore:
+                        response = await self.model.generate_content_async(prompt, stream=True)
+                    async for chunk in response:
+                        text = chunk.text
+                        if text:
+                            chunks.append(text)
+                            yield {"type": "chunk", "text": text}
+                    await response.resolve()
+                    response_text = "".join(chunks)
+                    future.set_result(response_text)
+                except Exception as e:
+                    future.set_exception(e)
+                    future.exception()  # mark retrieved when nobody else was waiting
+                    raise
+                finally:
+                    self._inflight.pop(key, None)
+                    # Cancelled, or the consumer stopped iterating
+                    if not future.done():
+                        future.cancel()
+                self.response_cache.put(prompt, response_text, cache_bucket, query)
+
+            self._remember(user_message, response_text)
+
+            turn = self._parse_turn_response(response_text, query, game_state)
+            yield {"type": "strategy", "strategy": asdict(turn.strategy)}
 
         except Exception as e:
-            logger.error(f"Strategy analysis failed: {e}")
-            return None
+            logger.error(f"Streaming strategy analysis failed: {e}")
+            yield {"type": "error", "message": "Unable to generate response."}
 
-    def answer_question(
+    async def answer_question(
         self,
         query: str,
         game_state: GameState,
@@ -209,46 +469,40 @@ Provide insightful, actionable recommendations backed by specific plays, formati
 
         try:
             # Retrieve context
-            context_items = self.context_store.retrieve_ranked_context(
+            context_items = self.context_store.retrieve_ranked_context_cached(
                 query=query,
                 top_k=15,
             )
 
-            context_summary = self.context_store.get_context_summary(
-                game_state=game_state.dict()
-            )
+            context_summary = self.context_store.get_state_summary(game_state.summary_key())
 
             # Build prompt
-            prompt = f"""You are analyzing a live NFL game. Answer this question with specific details:
-
-QUESTION: {query}
-
-GAME CONTEXT:
-{context_summary}
-
-INSTRUCTIONS:
-- Be concise but detailed
-- Reference specific plays or formations from the recent context
-- Provide tactical reasoning
-- Suggest specific player names when relevant
-- Include confidence levels for key claims"""
-
-            response = self.model.generate_content(prompt)
-
-            # Store in conversation
-            self.conversation_history.append({"role": "user", "content": query})
-            self.conversation_history.append({"role": "assistant", "content": response.text})
+            prompt = "\n".join((
+                "You are analyzing a live NFL game. Answer this question with specific details:",
+                "",
+                f"QUESTION: {query}",
+                "",
+                "GAME CONTEXT:",
+                context_summary,
+                "",
+                _QUESTION_INSTRUCTIONS,
+            ))
+
+            response_text = await self._generate(
+                prompt,
+                cache_bucket=self._cache_bucket("question", game_state),
+                cache_query=query,
+            )
 
-            if len(self.conversation_history) > self.max_history:
-                self.conversation_history = self.conversation_history[-self.max_history:]
+            self._remember(query, response_text)
 
-            return response.text.strip()
+            return response_text.strip()
 
         except Exception as e:
             logger.error(f"Question answering failed: {e}")
             return "Unable to generate response."
 
-    def get_player_recommendations(
+    async def get_player_recommendations(
         self,
         game_state: GameState,
         focus_team: Optional[str] = None,
@@ -267,32 +521,32 @@ INSTRUCTIONS:
             return []
 
         try:
-            context_items = self.context_store.retrieve_ranked_context(
+            context_items = self.context_store.retrieve_ranked_context_cached(
                 query="player performance strength weakness",
                 top_k=20,
                 team_filter=focus_team,
             )
 
-            context_summary = self.context_store.get_context_summary(
-                game_state=game_state.dict()
+            context_summary = self.context_store.get_state_summary(game_state.summary_key())
+
+            team = focus_team or game_state.possession
+            prompt = "\n".join((
+                "Analyze this game situation and recommend specific players and actions:",
+                "",
+                "GAME CONTEXT:",
+                context_summary,
+                "",
+                f"TEAM TO ANALYZE: {team}",
+                _PLAYER_INSTRUCTIONS,
+            ))
+
+            response_text = await self._generate(
+                prompt,
+                cache_bucket=self._cache_bucket("players", game_state, team),
             )
 
-            prompt = f"""Analyze this game situation and recommend specific players and actions:
-
-GAME CONTEXT:
-{context_summary}
-
-TEAM TO ANALYZE: {focus_team or game_state.possession}
-
-TASK: Provide 3-5 specific player recommendations with their positions and suggested actions.
-Format each as: PLAYER: [name] | POSITION: [QB/WR/RB/etc] | ACTION: [what they should do]
-
-Be specific and actionable."""
-
-            response = self.model.generate_content(prompt)
-
             # Parse player recommendations
-            recommendations = self._parse_player_recommendations(response.text)
+            recommendations = self._parse_player_recommendations(response_text)
 
             return recommendations
 
@@ -300,6 +554,27 @@ Be specific and actionable."""
             logger.error(f"Failed to get player recommendations: {e}")
             return []
 
+    async def analyze_bundle(
+        self,
+        queries: List[str],
+        game_state: GameState,
+    ) -> List[Optional[StrategyInsight]]:
+        """
+        Analyze several strategy queries concurrently.
+
+        Args:
+            queries: User questions about strategy
+            game_state: Current game state
+
+        Returns:
+            One insight (or None on failure) per query, in query order
+        """
+        results = await asyncio.gather(
+            *[self.analyze_strategy(query, game_state) for query in queries],
+            return_exceptions=True,
+        )
+        return [None if isinstance(r, BaseException) else r for r in results]
+
     def _build_analysis_prompt(
         self,
         query: str,
@@ -307,41 +582,75 @@ Be specific and actionable."""
         game_state: GameState,
     ) -> str:
         """Build the analysis prompt with context."""
-        return f"""GAME SITUATION:
-{context_summary}
-
-COACHING QUESTION: {query}
-
-ANALYSIS NEEDED:
-1. Identify opponent weaknesses from recent plays
-2. Suggest specific formations and plays to exploit
-3. Recommend key players to involve
-4. Explain the tactical reasoning
-5. Provide confidence level (0-100%)
+        return "\n".join((
+            "GAME SITUATION:",
+            context_summary,
+            "",
+            f"COACHING QUESTION: {query}",
+            _ANALYSIS_INSTRUCTIONS,
+        ))
+
+    def _parse_turn_response(
+        self,
+        response_text: str,
+        query: str,
+        game_state: GameState,
+    ) -> CoachingTurn:
+        """Split a combined JSON coaching response into its parts."""
+        data = self._load_json_response(response_text)
+        strategy = self._parse_strategy_response(response_text, query, game_state, data=data)
+
+        play_suggestion = data.get("play_suggestion") if data else None
+        return CoachingTurn(
+            strategy=strategy,
+            player_recommendations=strategy.player_recommendations,
+            play_suggestion=play_suggestion if isinstance(play_suggestion, dict) else {},
+        )
 
-Format your response with clear sections and specific player names."""
+    def _load_json_response(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """Return the JSON object embedded in a response, if any."""
+        json_blob = extract_json_object(response_text)
+        if not json_blob:
+            return None
+        try:
+            data = loads_json(json_blob)
+        except ValueError:
+            return None
+        return data if isinstance(data, dict) else None
 
     def _parse_strategy_response(
         self,
         response_text: str,
         query: str,
         game_state: GameState,
+        data: Optional[Dict[str, Any]] = None,
     ) -> StrategyInsight:
-        """Parse LLM response into structured strategy insight."""
+        """
+        Parse LLM response into structured strategy insight.
+
+        Structured JSON output (flat, or nested under "strategy") is read
+        directly; free text falls back to regex and keyword scanning.
+        """
+        if data is None:
+            data = self._load_json_response(response_text)
+        if data is not None:
+            strategy_data = data.get("strategy", data)
+            if isinstance(strategy_data, dict) and (
+                "description" in strategy_data or "reasoning" in strategy_data
+            ):
+                return self._strategy_from_json(strategy_data, data, response_text, query, game_state)
+
         try:
             # Extract confidence if mentioned
-            confidence_match = re.search(r'confidence[:\s]+(\d+)%?', response_text, re.IGNORECASE)
+            confidence_match = _CONFIDENCE_RE.search(response_text)
             confidence = float(confidence_match.group(1)) / 100 if confidence_match else 0.75
 
             # Extract player recommendations
             player_recs = self._parse_player_recommendations(response_text)
 
             # Extract play types
-            play_types = []
-            play_keywords = ["power running", "spread", "screen pass", "deep ball", "short slant", "play action"]
-            for keyword in play_keywords:
-                if keyword.lower() in response_text.lower():
-                    play_types.append(keyword)
+            lower_text = response_text.lower()
+            play_types = [keyword for keyword in _PLAY_KEYWORDS if keyword in lower_text]
 
             # Create title from query
             title = query[:50] + "..." if len(query) > 50 else query
@@ -352,7 +661,7 @@ Format your response with clear sections and specific player names."""
                 confidence=min(max(confidence, 0.0), 1.0),
                 player_recommendations=player_recs,
                 play_types=play_types,
-                reasoning=response_text,
+                reasoning=response_text[:_MAX_REASONING_CHARS],
                 quarter_context=f"Q{game_state.quarter} {game_state.clock}",
             )
 
@@ -364,19 +673,55 @@ Format your response with clear sections and specific player names."""
                 confidence=0.5,
                 player_recommendations=[],
                 play_types=[],
-                reasoning=response_text,
+                reasoning=response_text[:_MAX_REASONING_CHARS],
                 quarter_context=f"Q{game_state.quarter} {game_state.clock}",
             )
 
+    def _strategy_from_json(
+        self,
+        strategy_data: Dict[str, Any],
+        data: Dict[str, Any],
+        response_text: str,
+        query: str,
+        game_state: GameState,
+    ) -> StrategyInsight:
+        """Build a strategy insight from the model's JSON fields."""
+        raw_recs = data.get("player_recommendations") or strategy_data.get("player_recommendations") or []
+        player_recs = [
+            {
+                "name": str(rec.get("name", "")).strip(),
+                "position": str(rec.get("position", "")).strip(),
+                "action": str(rec.get("action", "")).strip(),
+            }
+            for rec in raw_recs
+            if isinstance(rec, dict)
+        ]
+
+        try:
+            confidence = float(strategy_data.get("confidence", 75))
+        except (TypeError, ValueError):
+            confidence = 75.0
+        if confidence > 1:
+            confidence /= 100
+
+        reasoning = str(strategy_data.get("reasoning") or response_text)
+        title = strategy_data.get("title") or (query[:50] + "..." if len(query) > 50 else query)
+
+        return StrategyInsight(
+            title=str(title),
+            description=str(strategy_data.get("description") or reasoning[:200]),
+            confidence=min(max(confidence, 0.0), 1.0),
+            player_recommendations=player_recs,
+            play_types=[str(p) for p in strategy_data.get("play_types") or []],
+            reasoning=reasoning[:_MAX_REASONING_CHARS],
+            quarter_context=f"Q{game_state.quarter} {game_state.clock}",
+        )
+
     def _parse_player_recommendations(self, text: str) -> List[Dict[str, str]]:
         """Extract player recommendations from text."""
         recommendations = []
 
-        # Pattern: PLAYER: [name] | POSITION: [pos] | ACTION: [action]
-        pattern = r'PLAYER:\s*([^|]+)\s*\|\s*POSITION:\s*([^|]+)\s*\|\s*ACTION:\s*([^|]+)'
-
-        matches = re.finditer(pattern, text, re.IGNORECASE)
-        for match in matches:
+        for match in _PLAYER_RE.finditer(text):
             recommendations.append({
                 "name": match.group(1).strip(),
                 "position": match.group(2).strip(),
@@ -393,6 +738,7 @@ Format your response with clear sections and specific player names."""
         """Reset the entire context store for a new match."""
         self.context_store.clear()
         self.conversation_history.clear()
+        self.response_cache.clear()
 
     def get_context_stats(self) -> Dict[str, Any]:
         """Get context store statistics."""
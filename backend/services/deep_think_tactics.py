@@ -5,19 +5,92 @@ Generates halftime and real-time tactics using Gemini's deep think model
 for complex strategic analysis based on live match data.
 """
 
+import asyncio
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, List
-import json
-import re
 
 import google.generativeai as genai
 
 from config import settings
 from models.schemas import GameState, AnalysisResult
+from services import gemini_pool
 from services.rag_context_store import RAGContextStore
+from services.llm_semantic_cache import SemanticLLMCache
+from utils.json_extract import extract_json_object, loads_json, dumps_json
 from utils.logger import logger
 
 
+# Static prompt sections, built once; only the game-specific fields are
+# formatted per call.
+_NEXT_PLAY_HEADER = "Analyze this football situation and suggest the optimal next play:\n"
+
+_NEXT_PLAY_INSTRUCTIONS = """
+ANALYZE AND RECOMMEND:
+1. Optimal play type (Pass/Run/Screen/Trick)
+2. Formation to use
+3. Key personnel
+4. Expected success probability
+5. Alternative options
+
+Format as JSON with fields: play_type, formation, key_personnel, success_probability, reasoning"""
+
+_HALFTIME_HEADER = """You are an elite NFL offensive and defensive coordinator with Super Bowl experience.
+Analyze the first half and generate comprehensive halftime adjustments and tactics.
+"""
+
+_HALFTIME_OFFENSE_ITEMS = """   - Identify defensive weaknesses exploited successfully in first half
+   - Identify defensive adjustments to expect
+   - Recommend key formations for second half
+   - Priority play calling strategy"""
+
+_HALFTIME_DEFENSE_ITEMS = """   - Analyze opponent's offensive success patterns
+   - Recommend defensive adjustments
+   - Key personnel assignments
+   - Coverage adjustments needed"""
+
+_HALFTIME_STATIC_SECTIONS = """3. PERSONNEL ADJUSTMENTS:
+   - Which players to feature more/less
+   - Rotation strategies
+   - Injury management if applicable
+
+4. TACTICAL PLAYBOOK:
+   - 5-7 specific plays recommended for second half
+   - Expected success rate for each
+   - Situational uses (3rd & short, goal line, two-minute drill)
+
+5. COUNTER STRATEGIES:
+   - Expected opponent adjustments
+   - How to counter them
+   - Alternative play packages
+
+6. PROBABILITY ANALYSIS:
+   - Estimated probability of winning with these tactics
+   - Critical success factors
+   - Risk assessment"""
+
+_HALFTIME_JSON_SCHEMA = """Format your response as valid JSON with this structure:
+{
+  "title": "Second Half Tactical Game Plan",
+  "summary": "Brief overview of strategy",
+  "offensive_strategy": "Detailed offensive approach",
+  "defensive_strategy": "Detailed defensive approach",
+  "key_formations": [
+    {"name": "formation name", "when_to_use": "situation", "success_rate": 0.65}
+  ],
+  "personnel_adjustments": [
+    {"player": "name", "action": "feature more/less/rotate", "reason": "why"}
+  ],
+  "play_calling_priorities": ["priority 1", "priority 2", "priority 3"],
+  "counter_measures": ["counter 1", "counter 2"],
+  "probability_of_success": 0.72,
+  "confidence": 0.85,
+  "reasoning": "detailed analysis",
+  "simulation_playbook": [
+    {"play_number": 1, "play_type": "pass", "formation": "11 personnel", "key_personnel": ["QB", "WR", "TE"], "expected_yards": 8, "success_probability": 0.68}
+  ]
+}"""
+
+
 @dataclass
 class HalftimeTactics:
     """Halftime tactical recommendations with detailed game plan."""
@@ -51,6 +124,8 @@ class DeepThinkTacticsService:
         self._initialized = False
         self.think_model = None
         self.thinking_enabled = True
+        self._semaphore = asyncio.Semaphore(settings.GEMINI_MAX_CONCURRENCY)
+        self.response_cache = SemanticLLMCache(threshold=0.9, ttl=300, maxsize=512)
 
     def initialize(self) -> bool:
         """Initialize Gemini models."""
@@ -62,20 +137,48 @@ class DeepThinkTacticsService:
             return False
 
         try:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
             # Use flash model for fast iterations
-            self.model = genai.GenerativeModel("gemini-2.5-flash")
+            self.model = gemini_pool.get_model("gemini-2.5-flash")
             # Use pro model for deep think if available
-            self.think_model = genai.GenerativeModel("gemini-2.5-pro")
+            self.think_model = gemini_pool.get_model("gemini-2.5-pro")
             self._initialized = True
             logger.info("Deep think tactics service initialized")
             return True
         except Exception as e:
             logger.error(f"Failed to initialize deep think service: {e}")
-            self.model = genai.GenerativeModel("gemini-2.5-flash")
+            self.model = gemini_pool.get_model("gemini-2.5-flash")
             self._initialized = True
             return True
 
+    async def _generate(
+        self,
+        model,
+        prompt: str,
+        generation_config=None,
+        cache_bucket: Optional[tuple] = None,
+    ) -> str:
+        """
+        Send a prompt to Gemini, bounded by the concurrency limit.
+
+        When cache_bucket is given, the same prompt answered in that bucket
+        is served from the response cache instead.
+        """
+        if cache_bucket is not None:
+            cached = self.response_cache.get(prompt, cache_bucket)
+            if cached is not None:
+                return cached
+
+        async with self._semaphore:
+            response = await model.generate_content_async(
+                prompt,
+                generation_config=generation_config,
+            )
+        text = response.text
+
+        if cache_bucket is not None:
+            self.response_cache.put(prompt, text, cache_bucket)
+        return text
+
     def add_game_event(
         self,
         event_type: str,
@@ -102,7 +205,7 @@ class DeepThinkTacticsService:
             details=details,
         )
 
-    def generate_halftime_tactics(
+    async def generate_halftime_tactics(
         self,
         game_state: GameState,
         possession_team: str = "KC",
@@ -127,14 +230,12 @@ class DeepThinkTacticsService:
 
         try:
             # Retrieve ranked context from first half
-            context_items = self.context_store.retrieve_ranked_context(
+            context_items = self.context_store.retrieve_ranked_context_cached(
                 query=f"offensive and defensive strategies for {possession_team}",
                 top_k=20,
             )
 
-            context_summary = self.context_store.get_context_summary(
-                game_state=game_state.dict()
-            )
+            context_summary = self.context_store.get_state_summary(game_state.summary_key())
 
             # Build comprehensive prompt for deep analysis
             prompt = self._build_halftime_prompt(
@@ -147,17 +248,24 @@ class DeepThinkTacticsService:
             # Use think model for extended reasoning if available
             model_to_use = self.think_model if self.think_model else self.model
 
-            response = model_to_use.generate_content(
+            response_text = await self._generate(
+                model_to_use,
                 prompt,
                 generation_config=genai.types.GenerationConfig(
                     temperature=0.8,
                     max_output_tokens=4000,
-                ) if model_to_use == self.think_model else None
+                ) if model_to_use == self.think_model else None,
+                cache_bucket=(
+                    "halftime",
+                    game_state.summary_key(),
+                    self.context_store.version,
+                    model_to_use is self.think_model,
+                ),
             )
 
             # Parse response into structured tactics
             tactics = self._parse_halftime_tactics(
-                response.text,
+                response_text,
                 game_state,
                 possession_team,
                 defense_team,
@@ -169,7 +277,7 @@ class DeepThinkTacticsService:
             logger.error(f"Halftime tactics generation failed: {e}")
             return None
 
-    def generate_next_play_suggestion(
+    async def generate_next_play_suggestion(
         self,
         game_state: GameState,
         recent_plays: List[Dict[str, Any]],
@@ -190,36 +298,34 @@ class DeepThinkTacticsService:
             return None
 
         try:
-            prompt = f"""Analyze this football situation and suggest the optimal next play:
-
-GAME STATE:
-- Quarter: {game_state.quarter}
-- Time: {game_state.clock}
-- Down: {game_state.down}
-- Distance: {game_state.distance} yards
-- Possession: {possession_team}
-- Score: {game_state.home_score} - {game_state.away_score}
-
-RECENT PLAYS:
-{json.dumps(recent_plays, indent=2)}
-
-ANALYZE AND RECOMMEND:
-1. Optimal play type (Pass/Run/Screen/Trick)
-2. Formation to use
-3. Key personnel
-4. Expected success probability
-5. Alternative options
-
-Format as JSON with fields: play_type, formation, key_personnel, success_probability, reasoning"""
-
-            response = self.model.generate_content(prompt)
+            recent_plays_text = dumps_json(recent_plays, indent=True)
+            prompt = "\n".join((
+                _NEXT_PLAY_HEADER,
+                "GAME STATE:",
+                f"- Quarter: {game_state.quarter}",
+                f"- Time: {game_state.clock}",
+                f"- Down: {game_state.down}",
+                f"- Distance: {game_state.distance} yards",
+                f"- Possession: {possession_team}",
+                f"- Score: {game_state.score.home} - {game_state.score.away}",
+                "",
+                "RECENT PLAYS:",
+                recent_plays_text,
+                _NEXT_PLAY_INSTRUCTIONS,
+            ))
+
+            response_text = await self._generate(
+                self.model,
+                prompt,
+                cache_bucket=("next_play", game_state.summary_key()),
+            )
 
             # Parse JSON response
             try:
-                suggestion = json.loads(response.text)
+                suggestion = loads_json(response_text)
                 return suggestion
             except:
-                return {"suggestion": response.text}
+                return {"suggestion": response_text}
 
         except Exception as e:
             logger.error(f"Play suggestion generation failed: {e}")
@@ -233,79 +339,36 @@ Format as JSON with fields: play_type, formation, key_personnel, success_probabi
         context_summary: str,
     ) -> str:
         """Build comprehensive halftime analysis prompt."""
-        return f"""You are an elite NFL offensive and defensive coordinator with Super Bowl experience.
-Analyze the first half and generate comprehensive halftime adjustments and tactics.
-
-FIRST HALF SUMMARY:
-{context_summary}
-
-GAME STATE:
-- Quarter: {game_state.quarter}
-- Half: {"Second" if game_state.quarter > 2 else "First"}
-- Current Score: {game_state.home_score} - {game_state.away_score}
-- Possession: {possession_team}
-- Down & Distance: {game_state.down} & {game_state.distance}
-- Clock: {game_state.clock}
-
-TEAMS:
-- Offensive Team: {possession_team}
-- Defensive Team: {defense_team}
-
-ANALYZE AND PROVIDE:
-
-1. OFFENSIVE STRATEGY (for {possession_team}):
-   - Identify defensive weaknesses exploited successfully in first half
-   - Identify defensive adjustments to expect
-   - Recommend key formations for second half
-   - Priority play calling strategy
-
-2. DEFENSIVE STRATEGY (for {defense_team}):
-   - Analyze opponent's offensive success patterns
-   - Recommend defensive adjustments
-   - Key personnel assignments
-   - Coverage adjustments needed
-
-3. PERSONNEL ADJUSTMENTS:
-   - Which players to feature more/less
-   - Rotation strategies
-   - Injury management if applicable
-
-4. TACTICAL PLAYBOOK:
-   - 5-7 specific plays recommended for second half
-   - Expected success rate for each
-   - Situational uses (3rd & short, goal line, two-minute drill)
-
-5. COUNTER STRATEGIES:
-   - Expected opponent adjustments
-   - How to counter them
-   - Alternative play packages
-
-6. PROBABILITY ANALYSIS:
-   - Estimated probability of winning with these tactics
-   - Critical success factors
-   - Risk assessment
-
-Format your response as valid JSON with this structure:
-{{
-  "title": "Second Half Tactical Game Plan",
-  "summary": "Brief overview of strategy",
-  "offensive_strategy": "Detailed offensive approach",
-  "defensive_strategy": "Detailed defensive approach",
-  "key_formations": [
-    {{"name": "formation name", "when_to_use": "situation", "success_rate": 0.65}}
-  ],
-  "personnel_adjustments": [
-    {{"player": "name", "action": "feature more/less/rotate", "reason": "why"}}
-  ],
-  "play_calling_priorities": ["priority 1", "priority 2", "priority 3"],
-  "counter_measures": ["counter 1", "counter 2"],
-  "probability_of_success": 0.72,
-  "confidence": 0.85,
-  "reasoning": "detailed analysis",
-  "simulation_playbook": [
-    {{"play_number": 1, "play_type": "pass", "formation": "11 personnel", "key_personnel": ["QB", "WR", "TE"], "expected_yards": 8, "success_probability": 0.68}}
-  ]
-}}"""
+        half = "Second" if game_state.quarter > 2 else "First"
+        return "\n".join((
+            _HALFTIME_HEADER,
+            "FIRST HALF SUMMARY:",
+            context_summary,
+            "",
+            "GAME STATE:",
+            f"- Quarter: {game_state.quarter}",
+            f"- Half: {half}",
+            f"- Current Score: {game_state.score.home} - {game_state.score.away}",
+            f"- Possession: {possession_team}",
+            f"- Down & Distance: {game_state.down} & {game_state.distance}",
+            f"- Clock: {game_state.clock}",
+            "",
+            "TEAMS:",
+            f"- Offensive Team: {possession_team}",
+            f"- Defensive Team: {defense_team}",
+            "",
+            "ANALYZE AND PROVIDE:",
+            "",
+            f"1. OFFENSIVE STRATEGY (for {possession_team}):",
+            _HALFTIME_OFFENSE_ITEMS,
+            "",
+            f"2. DEFENSIVE STRATEGY (for {defense_team}):",
+            _HALFTIME_DEFENSE_ITEMS,
+            "",
+            _HALFTIME_STATIC_SECTIONS,
+            "",
+            _HALFTIME_JSON_SCHEMA,
+        ))
 
     def _parse_halftime_tactics(
         self,
@@ -317,12 +380,12 @@ Format your response as valid JSON with this structure:
         """Parse LLM response into HalftimeTactics object."""
         try:
             # Extract JSON from response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if not json_match:
+            json_blob = extract_json_object(response_text)
+            if not json_blob:
                 logger.error("No JSON found in tactics response")
                 return None
 
-            data = json.loads(json_match.group())
+            data = loads_json(json_blob)
 
             return HalftimeTactics(
                 title=data.get("title", "Second Half Strategy"),
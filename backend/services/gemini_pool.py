@@ -0,0 +1,49 @@
+"""
+Gemini Model Pool
+
+Shares GenerativeModel instances between services. genai.configure() sets
+process-wide state, so it runs once here instead of in every service's
+initialize(), and each model name is built once and reused by all callers.
+"""
+
+import threading
+from typing import Dict
+
+import google.generativeai as genai
+
+from config import settings
+
+_models: Dict[str, genai.GenerativeModel] = {}
+_lock = threading.Lock()
+_configured = False
+
+
+def _configure() -> None:
+    """Configure the Gemini client with the API key (once per process)."""
+    global _configured
+    if not _configured:
+        genai.configure(api_key=settings.GEMINI_API_KEY)
+        _configured = True
+
+
+def get_model(name: str) -> genai.GenerativeModel:
+    """
+    Get the shared model instance for a model name.
+
+    Args:
+        name: Gemini model name, e.g. "gemini-2.5-flash"
+
+    Returns:
+        GenerativeModel shared by every caller asking for this name
+    """
+    model = _models.get(name)
+    if model is not None:
+        return model
+
+    with _lock:
+        _configure()
+        model = _models.get(name)
+        if model is None:
+            model = _models[name] = genai.GenerativeModel(name)
+        return model
+
@@ -0,0 +1,213 @@
+"""
+Semantic LLM Cache
+
+Caches LLM responses for a game context, so a repeated prompt, or a
+paraphrased question ("what's our run defense weakness?" / "where is the run
+D soft?") asked in the same context, is answered without another Gemini
+round trip.
+
+Entries are grouped into buckets that callers key on the full game context
+(GameState.summary_key() plus the context store version), so an answer given
+in one game situation is never served in another. Entries expire after a TTL
+and are evicted least-recently-used once the cache is full.
+
+Paraphrase matching needs a real sentence encoder (sentence-transformers).
+Without one the cache only serves exact prompt matches: bag-of-words vectors
+cannot tell "run" from "pass" questions apart reliably enough to share answers.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Hashable
+import hashlib
+import time
+
+import numpy as np
+
+from utils.logger import logger
+
+try:
+    from sentence_transformers import SentenceTransformer
+    SENTENCE_TRANSFORMERS_AVAILABLE = True
+except ImportError:
+    SENTENCE_TRANSFORMERS_AVAILABLE = False
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_encoder = None
+
+
+def _get_encoder():
+    """Load the sentence-transformers encoder once, if installed."""
+    global _encoder
+    if _encoder is None and SENTENCE_TRANSFORMERS_AVAILABLE:
+        try:
+            _encoder = SentenceTransformer(EMBEDDING_MODEL, device="cpu")
+            logger.info(f"Semantic cache using {EMBEDDING_MODEL}")
+        except Exception as e:
+            logger.warning(f"Failed to load {EMBEDDING_MODEL}, caching exact prompts only: {e}")
+            _encoder = False
+    return _encoder or None
+
+
+def warmup() -> None:
+    """Load the encoder and run dummy encodes so the first real query is fast."""
+    encoder = _get_encoder()
+    if encoder is not None:
+        for _ in range(2):
+            encoder.encode(["warmup query"])
+
+
+@lru_cache(maxsize=256)
+def embed(text: str) -> Optional[np.ndarray]:
+    """
+    Return the L2-normalized embedding for text (inner product = cosine).
+
+    Returns None when no sentence encoder is available.
+    """
+    encoder = _get_encoder()
+    if encoder is None:
+        return None
+
+    vector = np.asarray(encoder.encode(text), dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector = vector / norm
+    vector.setflags(write=False)
+    return vector
+
+
+def _digest(prompt: str) -> bytes:
+    return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+
+@dataclass
+class _CacheEntry:
+    """Single cached response."""
+
+    bucket: Hashable
+    embedding: Optional[np.ndarray]     # Query embedding, None if not matchable
+    value: str
+    expires_at: float
+
+
+class SemanticLLMCache:
+    """
+    Context-keyed cache of LLM responses.
+
+    Lookups first match the exact prompt in a bucket. When a sentence encoder
+    is loaded and a query is given, they fall back to the cached response of
+    the most similar query in the same bucket with cosine similarity >=
+    threshold.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        ttl: float = 300.0,
+        maxsize: int = 512,
+    ):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a semantic cache hit
+            ttl: Seconds before an entry expires
+            maxsize: Maximum entries kept (LRU eviction)
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # (bucket, prompt digest) -> entry
+        self._entries: "OrderedDict[tuple, _CacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+
+    def _best_match(self, bucket: Hashable, embedding: np.ndarray) -> tuple[Optional[tuple], float]:
+        """Find the live entry in a bucket whose query is most similar."""
+        keys = [
+            key for key, entry in self._entries.items()
+            if entry.bucket == bucket and entry.embedding is not None
+        ]
+        if not keys:
+            return None, 0.0
+
+        matrix = np.stack([self._entries[key].embedding for key in keys])
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        return keys[best], float(scores[best])
+
+    def get(self, prompt: str, bucket: Hashable = None, query: Optional[str] = None) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            prompt: Full prompt text; an identical prompt in the bucket hits
+            bucket: Partition key (game context); only entries in the same
+                bucket match
+            query: User question to match semantically, if paraphrases of it
+                may share an answer
+
+        Returns:
+            Cached response text, or None on a miss
+        """
+        self._expire()
+
+        key = (bucket, _digest(prompt))
+        if key not in self._entries and query is not None:
+            embedding = embed(query)
+            if embedding is not None:
+                match, score = self._best_match(bucket, embedding)
+                if match is not None and score >= self.threshold:
+                    logger.debug(f"Semantic cache hit (similarity {score:.3f})")
+                    key = match
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(self, prompt: str, value: str, bucket: Hashable = None, query: Optional[str] = None) -> None:
+        """
+        Store a response for a prompt.
+
+        Args:
+            prompt: Full prompt text the response answers
+            value: Response text
+            bucket: Partition key (game context)
+            query: User question, for semantic matching by later lookups
+        """
+        key = (bucket, _digest(prompt))
+        self._entries[key] = _CacheEntry(
+            bucket=bucket,
+            embedding=embed(query) if query is not None else None,
+            value=value,
+            expires_at=time.monotonic() + self.ttl,
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+
+    def get_stats(self) -> dict:
+        """Get cache statistics."""
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
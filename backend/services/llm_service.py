@@ -1,14 +1,47 @@
+import asyncio
 import base64
 import re
 from typing import Optional
-import google.generativeai as genai
-from PIL import Image
 import io
 
 from config import settings
 from models.schemas import AnalysisResult
+from services import gemini_pool
+from utils.image_parts import ImageInput, jpeg_part
 from utils.logger import logger
 
+# EVENT/DETAILS/CONFIDENCE fields of an event block, matched in one scan.
+# Text fields end at the next field label or the end of the line, so fields
+# on a single line ("EVENT: Pass DETAILS: deep CONFIDENCE: 0.3") separate.
+# The confidence capture is always a valid non-negative float literal.
+_FIELD_RE = re.compile(
+    r"EVENT:\s*(?P<event>.+?)(?=\s*(?:DETAILS|CONFIDENCE):|$)"
+    r"|DETAILS:\s*(?P<details>.+?)(?=\s*(?:EVENT|CONFIDENCE):|$)"
+    r"|CONFIDENCE:\s*(?P<confidence>\d+(?:\.\d*)?|\.\d+)",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Fallback event returned when the LLM is unavailable; copied per frame with
+# its timestamp instead of being validated again
+_FALLBACK_RESULT = AnalysisResult(
+    timestamp="",
+    event="Frame Captured",
+    details="Video frame captured for analysis. Enable Gemini API for detailed insights.",
+    confidence=0.5,
+)
+
+_FRAME_HEADER_RE = re.compile(r"^\s*\**FRAME\s+(\d+)\**:?\**", re.IGNORECASE | re.MULTILINE)
+
+_BATCH_PROMPT = """Analyze these {count} consecutive NFL game frames and detect events in each.
+
+For every frame, start a section with its label (FRAME 1:, FRAME 2:, ...) and list its events:
+EVENT: <type>
+DETAILS: <brief description>
+CONFIDENCE: <0.0-1.0>
+
+Separate multiple events within a frame with ---
+
+Detect: formations, plays, significant events (tackles, completions, sacks), ball location."""
+
 
 class LLMService:
     """Service for interacting with Gemini Vision API."""
@@ -27,8 +60,7 @@ class LLMService:
             return False
 
         try:
-            genai.configure(api_key=settings.GEMINI_API_KEY)
-            self._model = genai.GenerativeModel("gemini-2.5-flash")
+            self._model = gemini_pool.get_model("gemini-2.5-flash")
             self._initialized = True
             logger.info("Gemini Vision API initialized with gemini-2.5-flash (image vision analysis)")
             return True
@@ -36,12 +68,12 @@ class LLMService:
             logger.error(f"Failed to initialize Gemini: {e}")
             return False
 
-    async def analyze_frame(self, image: Image.Image, timestamp: str) -> list[AnalysisResult]:
+    async def analyze_frame(self, image: ImageInput, timestamp: str) -> list[AnalysisResult]:
         """
         Analyze a single video frame for football events.
 
         Args:
-            image: PIL Image of the frame
+            image: Frame as PIL Image, JPEG bytes or a prepared image part
             timestamp: Timestamp string for this frame
 
         Returns:
@@ -63,14 +95,67 @@ Separate multiple events with ---
 Detect: formations, plays, significant events (tackles, completions, sacks), ball location."""
 
         try:
-            response = self._model.generate_content([prompt, image])
+            response = await self._model.generate_content_async([prompt, jpeg_part(image)])
             return self._parse_analysis_response(response.text, timestamp)
         except Exception as e:
             logger.error(f"Frame analysis failed: {e}")
             return self._generate_fallback_analysis(timestamp)
 
+    async def analyze_frames_batch(
+        self, frames: list[tuple[ImageInput, str]]
+    ) -> list[list[AnalysisResult]]:
+        """
+        Analyze several video frames with a single Gemini request.
+
+        Args:
+            frames: List of (frame, timestamp) tuples; frames may be PIL
+                Images, JPEG bytes or prepared image parts
+
+        Returns:
+            Detected events per frame, in input order
+        """
+        if not frames:
+            return []
+        if len(frames) == 1:
+            image, timestamp = frames[0]
+            return [await self.analyze_frame(image, timestamp)]
+
+        if not self._initialized:
+            if not self.initialize():
+                return [self._generate_fallback_analysis(ts) for _, ts in frames]
+
+        contents: list = [_BATCH_PROMPT.format(count=len(frames))]
+        for i, (image, _) in enumerate(frames, start=1):
+            contents.extend((f"FRAME {i}:", jpeg_part(image)))
+
+        try:
+            response = await self._model.generate_content_async(contents)
+        except Exception as e:
+            logger.error(f"Batch frame analysis failed: {e}")
+            return [self._generate_fallback_analysis(ts) for _, ts in frames]
+
+        sections = self._split_frame_sections(response.text)
+        return [
+            self._parse_analysis_response(sections.get(i, ""), timestamp)
+            for i, (_, timestamp) in enumerate(frames, start=1)
+        ]
+
+    def _split_frame_sections(self, response_text: str) -> dict[int, str]:
+        """Split a batch response into per-frame text keyed by frame number."""
+        sections: dict[int, str] = {}
+        headers = list(_FRAME_HEADER_RE.finditer(response_text))
+        for header, next_header in zip(headers, headers[1:] + [None]):
+            end = next_header.start() if next_header else len(response_text)
+            sections[int(header.group(1))] = response_text[header.end():end]
+        return sections
+
     def _parse_analysis_response(self, response_text: str, timestamp: str) -> list[AnalysisResult]:
         """Parse the LLM response into structured AnalysisResult objects."""
+        # Nothing to parse without at least one EVENT: line
+        if not response_text or "event:" not in response_text.lower():
+            return self._generate_fallback_analysis(timestamp)
+
+        threshold = settings.CONFIDENCE_THRESHOLD
         results = []
         events = response_text.split("---")
 
@@ -79,20 +164,19 @@ Detect: formations, plays, significant events (tackles, completions, sacks), bal
             if not event_text:
                 continue
 
-            event_match = re.search(r"EVENT:\s*(.+)", event_text, re.IGNORECASE)
-            details_match = re.search(r"DETAILS:\s*(.+)", event_text, re.IGNORECASE)
-            confidence_match = re.search(r"CONFIDENCE:\s*([\d.]+)", event_text, re.IGNORECASE)
+            # One pass over the block; keep the first value of each field
+            fields: dict[str, str] = {}
+            for match in _FIELD_RE.finditer(event_text):
+                fields.setdefault(match.lastgroup, match.group(match.lastgroup))
 
-            if event_match:
-                event = event_match.group(1).strip()
-                details = details_match.group(1).strip() if details_match else "No details available"
-                try:
-                    confidence = float(confidence_match.group(1)) if confidence_match else 0.7
-                    confidence = min(max(confidence, 0.0), 1.0)
-                except ValueError:
-                    confidence = 0.7
+            if "event" in fields:
+                event = fields["event"].strip()
+                details = fields["details"].strip() if "details" in fields else "No details available"
+                confidence = float(fields["confidence"]) if "confidence" in fields else 0.7
+                if confidence > 1.0:
+                    confidence = 1.0
 
-                if confidence >= settings.CONFIDENCE_THRESHOLD:
+                if confidence >= threshold:
                     results.append(
                         AnalysisResult(
                             timestamp=timestamp,
@@ -106,14 +190,7 @@ Detect: formations, plays, significant events (tackles, completions, sacks), bal
 
     def _generate_fallback_analysis(self, timestamp: str) -> list[AnalysisResult]:
         """Generate fallback analysis when LLM is unavailable."""
-        return [
-            AnalysisResult(
-                timestamp=timestamp,
-                event="Frame Captured",
-                details="Video frame captured for analysis. Enable Gemini API for detailed insights.",
-                confidence=0.5,
-            )
-        ]
+        return [_FALLBACK_RESULT.model_copy(update={"timestamp": timestamp})]
 
     async def generate_play_description(self, events: list[AnalysisResult]) -> str:
         """Generate a natural language description of the play."""
@@ -130,7 +207,7 @@ Detect: formations, plays, significant events (tackles, completions, sacks), bal
 Write a brief, engaging play-by-play description (1-2 sentences) like an NFL commentator would deliver."""
 
         try:
-            response = self._model.generate_content(prompt)
+            response = await self._model.generate_content_async(prompt)
             return response.text.strip()
         except Exception as e:
             logger.error(f"Play description generation failed: {e}")
@@ -157,12 +234,30 @@ Recent plays detected:
 Provide a brief strategic recommendation (2-3 sentences) for the offensive team."""
 
         try:
-            response = self._model.generate_content(prompt)
+            response = await self._model.generate_content_async(prompt)
             return response.text.strip()
         except Exception as e:
             logger.error(f"Strategy recommendation failed: {e}")
             return "Unable to generate strategy recommendation."
 
+    async def generate_narration_and_strategy(
+        self, events: list[AnalysisResult], game_state: dict
+    ) -> tuple[str, str]:
+        """
+        Generate the play description and strategy recommendation concurrently.
+
+        The two requests are independent, so total latency is the slower of
+        the two rather than their sum.
+
+        Returns:
+            (play description, strategy recommendation)
+        """
+        description, strategy = await asyncio.gather(
+            self.generate_play_description(events),
+            self.generate_strategy_recommendation(game_state, events),
+        )
+        return description, strategy
+
 
 # Global singleton instance
 llm_service = LLMService()
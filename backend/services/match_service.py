@@ -1,10 +1,15 @@
 """
 Match Service - Handles database operations for match/session management
 """
-from sqlalchemy.orm import Session
-from typing import Optional, List, Dict, Any
+from sqlalchemy import Integer, JSON, String, case, cast, func, insert, literal, update
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.orm import Session, selectinload
+from typing import Optional, List, Dict, Any, Set, Tuple
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 import re
+import uuid
 
 from database.models import Match, AnalysisEvent, MatchHighlight, MatchMetrics, MatchStatus, SimulationSnapshot
 from database.connection import get_db_session
@@ -46,11 +51,68 @@ TEAM_PATTERNS: Dict[str, List[str]] = {
     'WAS': ['washington', 'commanders', 'was', 'wsh'],
 }
 
+# Team name/city/abbreviation pattern -> team abbreviation, scanned in one
+# pass; longer patterns first so "new orleans" wins over "ne"
+_TEAM_BY_PATTERN: Dict[str, str] = {
+    pattern: abbrev
+    for abbrev, patterns in TEAM_PATTERNS.items()
+    for pattern in patterns
+}
+_TEAM_NAME_RE = re.compile('|'.join(
+    re.escape(pattern) for pattern in sorted(_TEAM_BY_PATTERN, key=len, reverse=True)
+))
+
+# Whole-word team abbreviations, matched against upper-cased text
+_TEAM_ABBREV_RE = re.compile(r'\b(' + '|'.join(TEAM_PATTERNS) + r')\b')
+
+# Player name patterns, tried in order
+_PLAYER_RES = tuple(re.compile(p) for p in (
+    r'([A-Z]\.\s*[A-Z][a-z]+)',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+)',
+    r'\b(?:QB|RB|WR|TE|K)\s+([A-Z][a-z]+)',
+    r'#\d+\s+([A-Z][a-z]+)',
+))
+
+_YARDS_RE = re.compile(r'(\d+)\s*yard', re.IGNORECASE)
+
+# Keyword classifiers. Lowercased text is scanned once for every keyword and
+# each classifier checks the resulting set.
+_PASS_WORDS = frozenset(('pass', 'throw', 'reception', 'catch', 'incomplete'))
+_RUN_WORDS = frozenset(('run', 'rush', 'handoff', 'scramble'))
+_SPECIAL_WORDS = frozenset(('kick', 'punt', 'field goal', 'extra point'))
+_TURNOVER_WORDS = frozenset(('interception', 'fumble', 'turnover', 'pick'))
+_SCORING_WORDS = frozenset(('touchdown', 'field goal', 'safety', 'score', 'td'))
+
+# Formations, in priority order when several are mentioned
+_FORMATIONS = ('shotgun', 'i-form', 'spread', 'pistol', 'singleback',
+               'empty', 'jumbo', 'goal line', 'nickel', 'dime', '4-3', '3-4')
+
+# Lookahead so overlapping keywords ("field goal line") are all found;
+# "td"/"tds" only as a whole word
+_KEYWORD_RE = re.compile('(?=(' + '|'.join(
+    [r'\btd(?=s?\b)'] + [
+        re.escape(word) for word in sorted(
+            (_PASS_WORDS | _RUN_WORDS | _SPECIAL_WORDS | _TURNOVER_WORDS
+             | _SCORING_WORDS | frozenset(_FORMATIONS)) - {'td'},
+            key=len, reverse=True,
+        )
+    ]
+) + '))')
+
+
+def _keywords(text_lower: str) -> Set[str]:
+    """Find every classifier keyword in lowercased text in one scan"""
+    return {match.group(1) for match in _KEYWORD_RE.finditer(text_lower)}
+
 
 class MatchService:
     """Service for managing matches and analysis data in PostgreSQL"""
 
     _current_match_id: Optional[str] = None
+    # Recently seen match ids, least recently used first. Matches are never
+    # deleted, so a hit needs no existence check.
+    _known_match_ids: "OrderedDict[str, None]" = OrderedDict()
+    _known_match_ids_max = 64
 
     @classmethod
     def get_current_match_id(cls) -> Optional[str]:
@@ -62,6 +124,14 @@ class MatchService:
         """Set the current active match ID"""
         cls._current_match_id = match_id
 
+    @classmethod
+    def _remember_match_id(cls, match_id: str) -> None:
+        """Record a match id as existing, dropping the least recently seen"""
+        cls._known_match_ids[match_id] = None
+        cls._known_match_ids.move_to_end(match_id)
+        if len(cls._known_match_ids) > cls._known_match_ids_max:
+            cls._known_match_ids.popitem(last=False)
+
     @staticmethod
     def create_match(
         db: Session,
@@ -72,25 +142,39 @@ class MatchService:
         match = Match(
             home_team=home_team,
             away_team=away_team,
-            status=MatchStatus.ACTIVE,
+            status=MatchStatus.ACTIVE.value,
+            # Initial metrics, written in the same transaction
+            metrics=MatchMetrics(),
         )
         db.add(match)
-        db.commit()
-        db.refresh(match)
-
-        # Create initial metrics
-        metrics = MatchMetrics(match_id=match.id)
-        db.add(metrics)
+        db.flush()
+        # Read the id before commit expires the instance
+        match_id = match.id
         db.commit()
 
-        MatchService.set_current_match_id(match.id)
-        logger.info(f"Created new match: {match.id}")
+        MatchService._remember_match_id(match_id)
+        MatchService.set_current_match_id(match_id)
+        logger.info(f"Created new match: {match_id}")
         return match
 
     @staticmethod
     def get_match(db: Session, match_id: str) -> Optional[Match]:
-        """Get a match by ID"""
-        return db.query(Match).filter(Match.id == match_id).first()
+        """Get a match by ID (served from the session identity map when loaded)"""
+        match = db.get(Match, match_id)
+        if match:
+            MatchService._remember_match_id(match_id)
+        return match
+
+    @staticmethod
+    def match_exists(db: Session, match_id: str) -> bool:
+        """Check a match exists, skipping the query for ids already seen"""
+        if match_id in MatchService._known_match_ids:
+            MatchService._known_match_ids.move_to_end(match_id)
+            return True
+        if db.query(Match.id).filter(Match.id == match_id).first() is None:
+            return False
+        MatchService._remember_match_id(match_id)
+        return True
 
     @staticmethod
     def get_active_match(db: Session) -> Optional[Match]:
@@ -98,12 +182,12 @@ class MatchService:
         match_id = MatchService.get_current_match_id()
         if match_id:
             match = MatchService.get_match(db, match_id)
-            if match and match.status == MatchStatus.ACTIVE:
+            if match and match.status == MatchStatus.ACTIVE.value:
                 return match
 
         # Find most recent active match
         match = db.query(Match).filter(
-            Match.status == MatchStatus.ACTIVE
+            Match.status == MatchStatus.ACTIVE.value
         ).order_by(Match.created_at.desc()).first()
 
         if match:
@@ -118,12 +202,26 @@ class MatchService:
             match = MatchService.create_match(db)
         return match
 
+    @staticmethod
+    def get_or_create_active_match_id(db: Session) -> str:
+        """
+        Get the active match ID for hot paths that only need the ID.
+
+        Trusts the ID cached by this process (set when it created or found
+        the active match, cleared when it ends it) instead of re-reading the
+        match row on every call.
+        """
+        match_id = MatchService.get_current_match_id()
+        if match_id:
+            return match_id
+        return MatchService.get_or_create_active_match(db).id
+
     @staticmethod
     def end_match(db: Session, match_id: str) -> Optional[Match]:
         """End/complete a match"""
         match = MatchService.get_match(db, match_id)
         if match:
-            match.status = MatchStatus.COMPLETED
+            match.status = MatchStatus.COMPLETED.value
             db.commit()
             if MatchService.get_current_match_id() == match_id:
                 MatchService.set_current_match_id(None)
@@ -155,37 +253,131 @@ class MatchService:
         raw_data: Optional[Dict] = None
     ) -> AnalysisEvent:
         """Add an analysis event and update metrics"""
-        # Extract additional data from details
-        player_name = MatchService._extract_player_name(details)
-        yards = MatchService._extract_yards(details)
-        play_type = MatchService._classify_play_type(details)
-        formation = MatchService._extract_formation(details)
-        epa_value = MatchService._calculate_epa(details, event_type)
-
-        event = AnalysisEvent(
-            match_id=match_id,
-            timestamp=timestamp,
-            event_type=event_type,
-            details=details,
-            confidence=confidence,
-            player_name=player_name,
-            yards=yards,
-            play_type=play_type,
-            formation=formation,
-            is_explosive=MatchService._is_explosive(details, yards, play_type),
-            is_turnover=MatchService._is_turnover(details, event_type),
-            is_scoring=MatchService._is_scoring(details, event_type),
-            epa_value=epa_value,
-            raw_data=raw_data,
-        )
-        db.add(event)
+        return MatchService.add_analysis_events_bulk(db, match_id, [{
+            "timestamp": timestamp,
+            "event_type": event_type,
+            "details": details,
+            "confidence": confidence,
+            "raw_data": raw_data,
+        }])[0]
+
+    @staticmethod
+    def add_analysis_events_bulk(
+        db: Session,
+        match_id: str,
+        events: List[Dict[str, Any]]
+    ) -> List[AnalysisEvent]:
+        """
+        Add several analysis events and update metrics in one transaction.
+
+        Events are inserted with an executemany INSERT ... RETURNING (one
+        batched statement on PostgreSQL; SQLite cannot guarantee RETURNING
+        order for a batch, so SQLAlchemy inserts row by row there), their
+        metric deltas are summed into one UPDATE, and the batch is committed
+        once.
+
+        Args:
+            db: Database session
+            match_id: Match the events belong to
+            events: Dicts with timestamp, event_type, details, confidence
+                and optional raw_data
+
+        Returns:
+            Created events (transient, not attached to the session), in
+            input order
+        """
+        if not events:
+            return []
+
+        rows: List[Dict[str, Any]] = []
+        details_lower: List[str] = []
+        for event in events:
+            row, lowered = MatchService._build_event_row(match_id, **event)
+            rows.append(row)
+            details_lower.append(lowered)
+        # render_nulls keeps rows with different None columns in one batch;
+        # sort_by_parameter_order pairs each returned key with its row
+        generated = db.execute(
+            insert(AnalysisEvent)
+            .returning(AnalysisEvent.id, AnalysisEvent.created_at, sort_by_parameter_order=True)
+            .execution_options(render_nulls=True),
+            rows,
+        ).all()
+        # The rest of each row is known client-side; build transient copies
+        # (as in add_highlight) rather than loading instances commit expires
+        created = [
+            AnalysisEvent(**row, id=returned.id, created_at=returned.created_at)
+            for row, returned in zip(rows, generated)
+        ]
+
+        totals: Dict[str, float] = {}
+        formation_counts: Dict[str, int] = {}
+        for event, lowered in zip(created, details_lower):
+            deltas = MatchService._metric_deltas(event, lowered)
+            for column, delta in deltas.items():
+                totals[column] = totals.get(column, 0) + delta
+            if event.formation:
+                formation_counts[event.formation] = formation_counts.get(event.formation, 0) + 1
+
+        MatchService._apply_metric_deltas(db, match_id, totals, formation_counts)
         db.commit()
-        db.refresh(event)
+        return created
 
-        # Update metrics
-        MatchService._update_metrics(db, match_id, event)
+    @staticmethod
+    def _build_event_row(
+        match_id: str,
+        timestamp: str,
+        event_type: str,
+        details: str,
+        confidence: float,
+        raw_data: Optional[Dict] = None
+    ) -> Tuple[Dict[str, Any], str]:
+        """
+        Extract derived fields from event details into an insert row.
 
-        return event
+        Returns the row and the lowercased details it was classified from,
+        for callers that need the lowercased text again.
+        """
+        fields, details_lower = MatchService._derive_event_fields(details, event_type)
+        return {
+            "match_id": match_id,
+            "timestamp": timestamp,
+            "event_type": event_type,
+            "details": details,
+            "confidence": confidence,
+            **fields,
+            "raw_data": raw_data,
+        }, details_lower
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _derive_event_fields(details: str, event_type: str) -> Tuple[Dict[str, Any], str]:
+        """
+        Extract player, play type, formation and scoring fields from event text.
+
+        Consecutive frames often repeat the same details, so results are
+        cached; callers must copy the returned dict rather than modify it.
+
+        Returns:
+            The derived fields and the lowercased details
+        """
+        # Lowercase once; the classifiers below all take lowercased text
+        details_lower = details.lower()
+        event_lower = event_type.lower()
+        keywords = _keywords(details_lower)
+        event_keywords = _keywords(event_lower)
+        yards = MatchService._extract_yards(details_lower)
+        play_type = MatchService._classify_play_type(keywords)
+        return {
+            "player_name": MatchService._extract_player_name(details),
+            "yards": yards,
+            "play_type": play_type,
+            "formation": MatchService._extract_formation(keywords),
+            "is_explosive": MatchService._is_explosive(details_lower, yards, play_type),
+            "is_turnover": MatchService._is_turnover(keywords, event_keywords),
+            "is_scoring": MatchService._is_scoring(keywords, event_keywords),
+            "epa_value": MatchService._calculate_epa(details_lower, event_lower),
+        }, details_lower
 
     @staticmethod
     def add_highlight(
@@ -199,19 +391,21 @@ class MatchService:
         player_name: Optional[str] = None
     ) -> MatchHighlight:
         """Add a highlight capture"""
-        highlight = MatchHighlight(
-            match_id=match_id,
-            timestamp=timestamp,
-            event_type=event_type,
-            description=description,
-            confidence=confidence,
-            player_name=player_name or MatchService._extract_player_name(description),
-            image_data=image_data,
-        )
-        db.add(highlight)
+        row = {
+            "id": str(uuid.uuid4()),
+            "match_id": match_id,
+            "timestamp": timestamp,
+            "event_type": event_type,
+            "description": description,
+            "confidence": confidence,
+            "player_name": player_name or MatchService._extract_player_name(description),
+            "image_data": image_data,
+        }
+        db.execute(insert(MatchHighlight), row)
         db.commit()
-        db.refresh(highlight)
-        return highlight
+        # The row is fully known client-side; return a transient copy
+        # instead of reading it back
+        return MatchHighlight(**row)
 
     @staticmethod
     def get_match_events(
@@ -242,49 +436,12 @@ class MatchService:
     @staticmethod
     def get_all_matches(db: Session, limit: int = 20) -> List[Match]:
         """Get all matches (history)"""
-        return db.query(Match).order_by(Match.created_at.desc()).limit(limit).all()
-
-    @staticmethod
-    def save_simulation_snapshot(
-        db: Session,
-        match_id: str,
-        timestamp: str,
-        play_cycle: int,
-        sim_seconds_remaining: int,
-        quarter: int,
-        clock: str,
-        score_home: int,
-        score_away: int,
-        down: int,
-        distance: int,
-        possession: str,
-        line_of_scrimmage_y: float,
-        player_positions: Optional[Dict[str, Dict[str, float]]] = None,
-        ball_x: float = 0.0,
-        ball_y: float = 0.0
-    ) -> SimulationSnapshot:
-        """Save a simulation state snapshot"""
-        snapshot = SimulationSnapshot(
-            match_id=match_id,
-            timestamp=timestamp,
-            play_cycle=play_cycle,
-            sim_seconds_remaining=sim_seconds_remaining,
-            quarter=quarter,
-            clock=clock,
-            score_home=score_home,
-            score_away=score_away,
-            down=down,
-            distance=distance,
-            possession=possession,
-            line_of_scrimmage_y=line_of_scrimmage_y,
-            player_positions=player_positions,
-            ball_x=ball_x,
-            ball_y=ball_y,
-        )
-        db.add(snapshot)
-        db.commit()
-        db.refresh(snapshot)
-        return snapshot
+        # to_dict() reads events/highlights for counts; load them in one
+        # IN query per collection and fail loudly on anything deeper.
+        return db.query(Match).options(
+            selectinload(Match.events).raiseload("*"),
+            selectinload(Match.highlights).raiseload("*"),
+        ).order_by(Match.created_at.desc()).limit(limit).all()
 
     @staticmethod
     def get_simulation_snapshots(db: Session, match_id: str, limit: int = 500) -> List[SimulationSnapshot]:
@@ -304,21 +461,13 @@ class MatchService:
         if not text:
             return None
 
-        text_lower = text.lower()
-
-        for abbrev, patterns in TEAM_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in text_lower:
-                    return abbrev
+        match = _TEAM_NAME_RE.search(text.lower())
+        if match:
+            return _TEAM_BY_PATTERN[match.group(0)]
 
         # Also check for direct abbreviation matches (case insensitive)
-        text_upper = text.upper()
-        for abbrev in TEAM_PATTERNS.keys():
-            # Match whole word abbreviation
-            if re.search(rf'\b{abbrev}\b', text_upper):
-                return abbrev
-
-        return None
+        match = _TEAM_ABBREV_RE.search(text.upper())
+        return match.group(1) if match else None
 
     @staticmethod
     def extract_teams_from_event(details: str, event_type: str) -> Dict[str, Optional[str]]:
@@ -328,13 +477,11 @@ class MatchService:
         """
         combined_text = f"{details} {event_type}"
 
-        # Find all unique teams mentioned
-        found_teams = set()
-        for abbrev, patterns in TEAM_PATTERNS.items():
-            for pattern in patterns:
-                if pattern in combined_text.lower():
-                    found_teams.add(abbrev)
-                    break
+        # Find all unique teams mentioned, in order of first mention
+        found_teams = dict.fromkeys(
+            _TEAM_BY_PATTERN[match.group(0)]
+            for match in _TEAM_NAME_RE.finditer(combined_text.lower())
+        )
 
         teams_list = list(found_teams)
 
@@ -350,14 +497,8 @@ class MatchService:
     @staticmethod
     def _extract_player_name(details: str) -> Optional[str]:
         """Extract player name from event details"""
-        patterns = [
-            r'([A-Z]\.\s*[A-Z][a-z]+)',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+)',
-            r'\b(?:QB|RB|WR|TE|K)\s+([A-Z][a-z]+)',
-            r'#\d+\s+([A-Z][a-z]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, details)
+        for pattern in _PLAYER_RES:
+            match = pattern.search(details)
             if match:
                 return match.group(1)
         return None
@@ -365,40 +506,33 @@ class MatchService:
     @staticmethod
     def _extract_yards(details: str) -> Optional[int]:
         """Extract yard gain/loss from details"""
-        match = re.search(r'(\d+)\s*yard', details.lower())
+        match = _YARDS_RE.search(details)
         if match:
             return int(match.group(1))
         return None
 
     @staticmethod
-    def _classify_play_type(details: str) -> Optional[str]:
-        """Classify play as pass, run, or special"""
-        details_lower = details.lower()
-        if any(word in details_lower for word in ['pass', 'throw', 'reception', 'catch', 'incomplete']):
+    def _classify_play_type(keywords: Set[str]) -> Optional[str]:
+        """Classify play as pass, run, or special from the details keywords"""
+        if keywords & _PASS_WORDS:
             return 'pass'
-        elif any(word in details_lower for word in ['run', 'rush', 'handoff', 'scramble']):
+        elif keywords & _RUN_WORDS:
             return 'run'
-        elif any(word in details_lower for word in ['kick', 'punt', 'field goal', 'extra point']):
+        elif keywords & _SPECIAL_WORDS:
             return 'special'
         return None
 
     @staticmethod
-    def _extract_formation(details: str) -> Optional[str]:
-        """Extract formation from details"""
-        formations = ['shotgun', 'i-form', 'spread', 'pistol', 'singleback',
-                      'empty', 'jumbo', 'goal line', 'nickel', 'dime', '4-3', '3-4']
-        details_lower = details.lower()
-        for formation in formations:
-            if formation in details_lower:
+    def _extract_formation(keywords: Set[str]) -> Optional[str]:
+        """Extract formation from the details keywords"""
+        for formation in _FORMATIONS:
+            if formation in keywords:
                 return formation.title()
         return None
 
     @staticmethod
-    def _calculate_epa(details: str, event_type: str) -> float:
-        """Calculate Expected Points Added for the event"""
-        details_lower = details.lower()
-        event_lower = event_type.lower()
-
+    def _calculate_epa(details_lower: str, event_lower: str) -> float:
+        """Calculate Expected Points Added for the event (expects lowercased text)"""
         if 'touchdown' in details_lower or 'score' in event_lower:
             return 6.0 + (0.5 if 'pass' in details_lower else 0)
         elif 'first down' in details_lower:
@@ -412,7 +546,7 @@ class MatchService:
         elif 'incomplete' in details_lower:
             return -0.5
         elif 'gain' in details_lower or 'yard' in details_lower:
-            yards = MatchService._extract_yards(details)
+            yards = MatchService._extract_yards(details_lower)
             if yards:
                 return (yards - 4) * 0.15
         return 0.0
@@ -428,86 +562,133 @@ class MatchService:
         return False
 
     @staticmethod
-    def _is_turnover(details: str, event_type: str) -> bool:
-        """Check if event is a turnover"""
-        keywords = ['interception', 'fumble', 'turnover', 'pick']
-        combined = f"{details} {event_type}".lower()
-        return any(word in combined for word in keywords)
+    def _is_turnover(keywords: Set[str], event_keywords: Set[str]) -> bool:
+        """Check if event is a turnover from the details and event type keywords"""
+        return bool(keywords & _TURNOVER_WORDS or event_keywords & _TURNOVER_WORDS)
 
     @staticmethod
-    def _is_scoring(details: str, event_type: str) -> bool:
-        """Check if event is a scoring play"""
-        keywords = ['touchdown', 'field goal', 'safety', 'score', 'td']
-        combined = f"{details} {event_type}".lower()
-        return any(word in combined for word in keywords)
+    def _is_scoring(keywords: Set[str], event_keywords: Set[str]) -> bool:
+        """Check if event is a scoring play from the details and event type keywords"""
+        return bool(keywords & _SCORING_WORDS or event_keywords & _SCORING_WORDS)
 
     @staticmethod
-    def _update_metrics(db: Session, match_id: str, event: AnalysisEvent):
-        """Update match metrics based on new event"""
-        metrics = db.query(MatchMetrics).filter(
-            MatchMetrics.match_id == match_id
-        ).first()
-
-        if not metrics:
-            metrics = MatchMetrics(match_id=match_id)
-            db.add(metrics)
-
-        # Update EPA and WPA
-        metrics.total_epa += event.epa_value
-        wpa_shift = event.epa_value * 1.5
-        metrics.win_probability = max(5, min(95, metrics.win_probability + wpa_shift))
-
-        # Update play counts
+    def _metric_deltas(event: AnalysisEvent, details_lower: Optional[str] = None) -> Dict[str, float]:
+        """Compute the metric column increments contributed by an event"""
+        deltas: Dict[str, float] = {
+            "total_epa": event.epa_value,
+            "win_probability": event.epa_value * 1.5,
+        }
+
+        # Play counts
         if event.play_type == 'pass':
-            metrics.pass_plays += 1
+            deltas["pass_plays"] = 1
         elif event.play_type == 'run':
-            metrics.run_plays += 1
+            deltas["run_plays"] = 1
         elif event.play_type == 'special':
-            metrics.special_plays += 1
+            deltas["special_plays"] = 1
 
-        # Update explosive plays
+        # Explosive plays
         if event.is_explosive:
             if event.play_type == 'pass':
-                metrics.explosive_passes += 1
+                deltas["explosive_passes"] = 1
             else:
-                metrics.explosive_runs += 1
+                deltas["explosive_runs"] = 1
 
-        # Update turnovers
-        if event.is_turnover:
+        if details_lower is None:
             details_lower = event.details.lower()
+
+        # Turnovers
+        if event.is_turnover:
             if 'forced' in details_lower or 'recovered' in details_lower:
-                metrics.turnovers_forced += 1
+                deltas["turnovers_forced"] = 1
             else:
-                metrics.turnovers_lost += 1
+                deltas["turnovers_lost"] = 1
 
-        # Update third down
-        if 'third down' in event.details.lower() or '3rd down' in event.details.lower():
-            metrics.third_down_attempts += 1
-            if 'conversion' in event.details.lower() or 'first down' in event.details.lower():
-                metrics.third_down_conversions += 1
+        # Third down
+        if 'third down' in details_lower or '3rd down' in details_lower:
+            deltas["third_down_attempts"] = 1
+            if 'conversion' in details_lower or 'first down' in details_lower:
+                deltas["third_down_conversions"] = 1
 
-        # Update red zone
-        if 'red zone' in event.details.lower() or 'inside 20' in event.details.lower():
-            metrics.red_zone_attempts += 1
+        # Red zone
+        if 'red zone' in details_lower or 'inside 20' in details_lower:
+            deltas["red_zone_attempts"] = 1
             if event.is_scoring:
-                metrics.red_zone_touchdowns += 1
-
-        # Update formations
-        if event.formation:
-            formations = metrics.formations_detected or []
-            formation_entry = {"name": event.formation, "count": 1}
-            # Update existing or add new
-            found = False
-            for f in formations:
-                if f.get("name") == event.formation:
-                    f["count"] = f.get("count", 0) + 1
-                    found = True
-                    break
-            if not found:
-                formations.append(formation_entry)
-            metrics.formations_detected = formations
+                deltas["red_zone_touchdowns"] = 1
 
-        db.commit()
+        return deltas
+
+    @staticmethod
+    def _apply_metric_deltas(
+        db: Session,
+        match_id: str,
+        deltas: Dict[str, float],
+        formation_counts: Optional[Dict[str, int]] = None
+    ):
+        """
+        Apply metric increments with a single atomic UPDATE.
+
+        Each column is set to ``column + delta`` server-side, so concurrent
+        writers cannot lose updates and no SELECT is needed first. Formation
+        counts are incremented inside the formations JSON object by the same
+        statement.
+        """
+        values = {
+            column: getattr(MatchMetrics, column) + delta
+            for column, delta in deltas.items()
+            if delta and column != "win_probability"
+        }
+        wpa_shift = deltas.get("win_probability")
+        if wpa_shift:
+            shifted = MatchMetrics.win_probability + wpa_shift
+            values["win_probability"] = case(
+                (shifted < 5, 5), (shifted > 95, 95), else_=shifted
+            )
+        if formation_counts:
+            values["formations_detected"] = MatchService._formations_increment(
+                db.get_bind().dialect.name, formation_counts
+            )
+        if not values:
+            return
+
+        stmt = (
+            update(MatchMetrics)
+            .where(MatchMetrics.match_id == match_id)
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if db.execute(stmt).rowcount == 0:
+            # No metrics row yet (e.g. match created elsewhere)
+            db.add(MatchMetrics(match_id=match_id))
+            db.flush()
+            db.execute(stmt)
+
+    @staticmethod
+    def _formations_increment(dialect_name: str, counts: Dict[str, int]):
+        """
+        Build the SQL expression adding counts to the formations JSON object.
+
+        Values that are not a JSON object (legacy list format) start over.
+        """
+        column = MatchMetrics.formations_detected
+        if dialect_name == "postgresql":
+            current = cast(column, JSONB)
+            merged = case(
+                (func.jsonb_typeof(current) == "object", current),
+                else_=cast(literal("{}"), JSONB),
+            )
+            for name, count in counts.items():
+                previous = func.coalesce(cast(current.op("->>")(literal(name, String)), Integer), 0)
+                merged = func.jsonb_set(merged, array([name]), func.to_jsonb(previous + count))
+            return cast(merged, JSON)
+
+        # SQLite JSON1: json_set takes any number of path/value pairs
+        merged = case((func.json_type(column) == "object", column), else_=literal("{}"))
+        pairs = []
+        for name, count in counts.items():
+            path = f'$."{name}"'
+            pairs += [path, func.coalesce(func.json_extract(column, path), 0) + count]
+        return func.json_set(merged, *pairs)
 
 
 # Singleton instance helper
@@ -5,21 +5,263 @@ Manages live match data with ranking and retrieval for deep research queries.
 Implements context compression and relevance scoring.
 """
 
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from functools import lru_cache
+from typing import Optional, Dict, List, Any, Sequence
+import heapq
 import json
-from enum import Enum
+import re
+from enum import IntEnum
+
+import numpy as np
 
 from utils.logger import logger
 
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+class ContextImportance(IntEnum):
+    """Importance levels for context items, ordered least to most important."""
+    LOW = 1                    # Minor events, routine plays
+    MEDIUM = 2                 # Regular plays, position changes
+    HIGH = 3                   # Explosive plays, formation changes
+    CRITICAL = 4               # Turnovers, scoring plays, key stops
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in serialized output, e.g. "critical"."""
+        return self.name.lower()
+
+
+# Rank score multiplier, indexed by importance level
+_IMPORTANCE_WEIGHT = (0.0, 0.4, 0.6, 0.8, 1.0)
+
+
+def _top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    Indices of the top_k highest scores, best first.
+
+    Uses argpartition to select candidates in O(n); ties keep insertion
+    order, matching a stable descending sort.
+    """
+    n = len(scores)
+    if top_k >= n:
+        return np.argsort(-scores, kind="stable")
+    if top_k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    threshold = scores[np.argpartition(-scores, top_k - 1)[top_k - 1]]
+    above = np.flatnonzero(scores > threshold)
+    ties = np.flatnonzero(scores == threshold)[: top_k - len(above)]
+    candidates = np.concatenate((above, ties))
+    candidates.sort()
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def _jit(func):
+    """Compile a kernel with numba when installed."""
+    return numba.njit(cache=True)(func) if NUMBA_AVAILABLE else func
+
+
+@_jit
+def _ranks_below(score_a: float, index_a: int, score_b: float, index_b: int) -> bool:
+    """Whether candidate a ranks below b (lower score, or same score added later)."""
+    return score_a < score_b or (score_a == score_b and index_a > index_b)
+
+
+@_jit
+def _sift_down(heap_score: np.ndarray, heap_index: np.ndarray, size: int) -> None:
+    """Restore the min-heap (lowest-ranked candidate at the root) from the root."""
+    parent = 0
+    while True:
+        lowest = parent
+        for child in (2 * parent + 1, 2 * parent + 2):
+            if child < size and _ranks_below(
+                heap_score[child], heap_index[child], heap_score[lowest], heap_index[lowest]
+            ):
+                lowest = child
+        if lowest == parent:
+            return
+        heap_score[parent], heap_score[lowest] = heap_score[lowest], heap_score[parent]
+        heap_index[parent], heap_index[lowest] = heap_index[lowest], heap_index[parent]
+        parent = lowest
+
+
+@_jit
+def _top_k_kernel(
+    recency: np.ndarray,
+    relevance: np.ndarray,
+    weight: np.ndarray,
+    positions: np.ndarray,
+    top_k: int,
+) -> np.ndarray:
+    """
+    Rank-score the given column positions and select the top_k in one pass.
+
+    Same result as _top_k_indices() over _ContextColumns.scores(), without
+    the intermediate score arrays: a size-k min-heap keeps the best
+    candidates seen so far.
+
+    Returns:
+        Indices into positions, best first; ties keep insertion order
+    """
+    k = max(min(top_k, len(positions)), 0)
+    heap_score = np.empty(k, dtype=np.float64)
+    heap_index = np.empty(k, dtype=np.int64)
+    size = 0
+    for j in range(len(positions)):
+        p = positions[j]
+        score = (recency[p] + relevance[p]) * weight[p] / 2
+        if size < k:
+            # Sift the new candidate up from the end
+            child = size
+            size += 1
+            while child > 0:
+                parent = (child - 1) // 2
+                if not _ranks_below(score, j, heap_score[parent], heap_index[parent]):
+                    break
+                heap_score[child] = heap_score[parent]
+                heap_index[child] = heap_index[parent]
+                child = parent
+            heap_score[child] = score
+            heap_index[child] = j
+        elif k > 0 and score > heap_score[0]:
+            heap_score[0] = score
+            heap_index[0] = j
+            _sift_down(heap_score, heap_index, size)
+
+    # Pop the lowest-ranked candidate into the back of the output
+    order = np.empty(k, dtype=np.int64)
+    while size > 0:
+        size -= 1
+        order[size] = heap_index[0]
+        heap_score[0] = heap_score[size]
+        heap_index[0] = heap_index[size]
+        _sift_down(heap_score, heap_index, size)
+    return order
+
+
+if NUMBA_AVAILABLE:
+    # Compile outside the request path
+    _top_k_kernel(np.zeros(1), np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.intp), 1)
+
+
+# Event type keywords and their relevance, in priority order: when several
+# appear in an event type, the earliest listed wins
+_EVENT_TYPE_SCORES = (
+    ("pass", 0.7), ("run", 0.7), ("turnover", 0.9),
+    ("scoring", 0.95), ("sack", 0.8), ("interception", 0.9),
+    ("fumble", 0.9), ("touchdown", 0.95), ("field_goal", 0.85),
+)
+_EVENT_TYPE_RANK = {keyword: rank for rank, (keyword, _) in enumerate(_EVENT_TYPE_SCORES)}
+# Lookahead finds overlapping keywords in one scan
+_EVENT_TYPE_RE = re.compile(
+    "(?=(" + "|".join(keyword for keyword, _ in _EVENT_TYPE_SCORES) + "))",
+    re.IGNORECASE,
+)
+
+
+def _event_type_score(event_type: str) -> float:
+    """Relevance of an event type: its highest-priority keyword, else 0.5."""
+    ranks = [_EVENT_TYPE_RANK[match.group(1).lower()] for match in _EVENT_TYPE_RE.finditer(event_type)]
+    return _EVENT_TYPE_SCORES[min(ranks)][1] if ranks else 0.5
+
+
+def _parse_clock(timestamp: str) -> Optional[int]:
+    """Parse an MM:SS (or MM) game clock into seconds, None if malformed."""
+    try:
+        parts = timestamp.split(":")
+        minutes = int(parts[0])
+        seconds = int(parts[1]) if len(parts) > 1 else 0
+        return minutes * 60 + seconds
+    except (AttributeError, ValueError):
+        return None
+
+
+class _ContextColumns:
+    """
+    Structure-of-arrays view of the store's items, in insertion order.
+
+    Holds the numeric and filter fields of every item in parallel arrays so
+    filtering and rank scoring run as vectorized NumPy operations. The
+    ContextItem objects remain the records handed to callers. Removed items
+    leave a dead slot until the columns are rebuilt.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self.items: List[Optional["ContextItem"]] = []
+        self.position: Dict[str, int] = {}
+        self.dead = 0
+        self.alive = np.empty(capacity, dtype=bool)
+        self.recency = np.empty(capacity, dtype=np.float64)
+        # Recency derived from each item's game clock, and whether the item's
+        # recency_score already holds it
+        self.clock_recency = np.empty(capacity, dtype=np.float64)
+        self.rescored = np.empty(capacity, dtype=bool)
+        self.relevance = np.empty(capacity, dtype=np.float64)
+        self.weight = np.empty(capacity, dtype=np.float64)
+        self.importance = np.empty(capacity, dtype=np.int8)
+        self.team = np.empty(capacity, dtype=object)
+
+    def append(self, item: "ContextItem", clock_recency: float) -> None:
+        """Add an item to the end of the columns."""
+        i = len(self.items)
+        if i == len(self.recency):
+            self._grow(2 * i)
+        self.items.append(item)
+        self.position[item.id] = i
+        self.alive[i] = True
+        self.recency[i] = item.recency_score
+        self.clock_recency[i] = clock_recency
+        self.rescored[i] = item.recency_score == clock_recency
+        self.relevance[i] = item.relevance_score
+        self.weight[i] = _IMPORTANCE_WEIGHT[item.importance]
+        self.importance[i] = item.importance
+        self.team[i] = item.team
+
+    def remove(self, item_id: str) -> None:
+        """Mark an item's slot dead."""
+        i = self.position.pop(item_id)
+        self.items[i] = None
+        self.alive[i] = False
+        self.dead += 1
 
-class ContextImportance(str, Enum):
-    """Importance levels for context items."""
-    CRITICAL = "critical"      # Turnovers, scoring plays, key stops
-    HIGH = "high"              # Explosive plays, formation changes
-    MEDIUM = "medium"          # Regular plays, position changes
-    LOW = "low"                # Minor events, routine plays
+    def clear(self) -> None:
+        """Drop all items (capacity is kept)."""
+        self.items = []
+        self.position = {}
+        self.dead = 0
+
+    def _grow(self, capacity: int) -> None:
+        for name in ("alive", "recency", "clock_recency", "rescored", "relevance", "weight", "importance", "team"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def select(
+        self,
+        importance_filter: Optional[ContextImportance],
+        team_filter: Optional[str],
+    ) -> np.ndarray:
+        """Positions of items passing the importance and team filters."""
+        n = len(self.items)
+        mask = self.alive[:n].copy()
+        if importance_filter is not None:
+            mask &= self.importance[:n] >= importance_filter
+        if team_filter:
+            mask &= self.team[:n] == team_filter
+        return np.flatnonzero(mask)
+
+    def scores(self, positions: np.ndarray) -> np.ndarray:
+        """Rank scores (see ContextItem.get_rank_score) at the given positions."""
+        return (self.recency[positions] + self.relevance[positions]) * self.weight[positions] / 2
 
 
 @dataclass
@@ -35,19 +277,24 @@ class ContextItem:
     player_name: Optional[str] = None          # Player involved
     details: Dict[str, Any] = field(default_factory=dict)  # Additional data
     recency_score: float = 1.0                # Based on time (0-1)
+    total_seconds: Optional[int] = None       # Parsed timestamp, None if malformed
     relevance_score: float = 1.0              # Based on content (0-1)
+    # Cached get_rank_score(); reset to None whenever a score changes
+    _rank_score: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    # Insertion sequence number, breaks rank ties in eviction
+    _seq: int = field(default=0, init=False, repr=False, compare=False)
+    # Lowercased description for query matching
+    _description_lower: str = field(default="", init=False, repr=False, compare=False)
 
-    def get_rank_score(self) -> float:
-        """Calculate combined ranking score."""
-        importance_weight = {
-            ContextImportance.CRITICAL: 1.0,
-            ContextImportance.HIGH: 0.8,
-            ContextImportance.MEDIUM: 0.6,
-            ContextImportance.LOW: 0.4,
-        }
+    def __post_init__(self):
+        self._description_lower = self.description.lower()
 
-        importance_mult = importance_weight[self.importance]
-        return (self.recency_score + self.relevance_score) * importance_mult / 2
+    def get_rank_score(self) -> float:
+        """Calculate combined ranking score (cached until the scores change)."""
+        if self._rank_score is None:
+            importance_mult = _IMPORTANCE_WEIGHT[self.importance]
+            self._rank_score = (self.recency_score + self.relevance_score) * importance_mult / 2
+        return self._rank_score
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -56,7 +303,7 @@ class ContextItem:
             "timestamp": self.timestamp,
             "event_type": self.event_type,
             "description": self.description,
-            "importance": self.importance.value,
+            "importance": self.importance.label,
             "team": self.team,
             "player_name": self.player_name,
             "details": self.details,
@@ -72,20 +319,28 @@ class RAGContextStore:
     Implements context compression and relevance scoring.
     """
 
-    def __init__(self, max_items: int = 500, compression_threshold: int = 100):
+    def __init__(self, max_items: int = 500):
         """
         Initialize the RAG context store.
 
         Args:
-            max_items: Maximum items to keep in store
-            compression_threshold: Trigger context compression at this size
+            max_items: Maximum items to keep in store; the lowest-ranked
+                item is evicted whenever an add goes over it
         """
         self.max_items = max_items
-        self.compression_threshold = compression_threshold
         self.items: Dict[str, ContextItem] = {}
         self.event_counter = 0
         self.creation_time = datetime.now()
         self.last_compression_time = datetime.now()
+        # Bumped whenever items change; memoized results are keyed on it
+        self.version = 0
+        self._memo: Dict[tuple, Any] = {}
+        self._memo_version = 0
+        self._memo_maxsize = 64
+        self._columns = _ContextColumns()
+        # Lazy min-heap of (rank score, -seq, id); entries whose score no
+        # longer matches the item are skipped when popped
+        self._rank_heap: List[tuple] = []
 
     def add_event(
         self,
@@ -117,7 +372,7 @@ class RAGContextStore:
 
         # Calculate initial scores
         recency_score = 1.0  # New events have high recency
-        relevance_score = self._calculate_relevance_score(event_type, description)
+        relevance_score = self._calculate_relevance_score(event_type)
 
         item = ContextItem(
             id=event_id,
@@ -130,15 +385,20 @@ class RAGContextStore:
             details=details or {},
             recency_score=recency_score,
             relevance_score=relevance_score,
+            total_seconds=_parse_clock(timestamp),
         )
 
+        item._seq = self.event_counter
         self.items[event_id] = item
+        self._index(item)
+        self._push_rank(item)
+        self.version += 1
 
-        logger.debug(f"Added context item: {event_id} (importance: {importance})")
+        logger.debug("Added context item: %s (importance: %s)", event_id, importance.label)
 
-        # Check if compression needed
-        if len(self.items) > self.compression_threshold:
-            self._compress_context()
+        # Evict the lowest-ranked items once the store is full
+        while len(self.items) > self.max_items:
+            self._evict_lowest()
 
         return event_id
 
@@ -155,48 +415,96 @@ class RAGContextStore:
         Args:
             query: Optional query string for relevance scoring
             top_k: Number of items to retrieve
-            importance_filter: Filter by importance level
+            importance_filter: Minimum importance level to include
             team_filter: Filter by team
 
         Returns:
             Ranked list of context items
         """
-        filtered_items = self.items.values()
-
-        # Apply filters
-        if importance_filter:
-            filtered_items = [
-                item for item in filtered_items
-                if item.importance.value >= importance_filter.value
-            ]
-
-        if team_filter:
-            filtered_items = [
-                item for item in filtered_items
-                if item.team == team_filter
-            ]
-
-        # Update relevance scores if query provided
+        columns = self._columns
+        positions = columns.select(importance_filter, team_filter)
+
+        # Recency depends only on the game clock, so only items not rescored
+        # since they were added need their recency_score written; a query
+        # rescores relevance on every filtered item, but only items whose
+        # score actually changed are re-ranked
+        columns.recency[positions] = columns.clock_recency[positions]
+        stale = positions if query else positions[~columns.rescored[positions]]
         if query:
-            for item in filtered_items:
-                item.relevance_score = self._calculate_relevance_score(
-                    item.event_type,
-                    item.description,
-                    query
+            query_lower = query.lower()
+        for i in stale:
+            item = columns.items[i]
+            # Update relevance score if query provided
+            if query:
+                relevance = self._query_relevance(
+                    item.event_type, item._description_lower, query_lower
                 )
+                if columns.rescored[i] and relevance == item.relevance_score:
+                    continue
+                item.relevance_score = relevance
+                columns.relevance[i] = relevance
+            item.recency_score = float(columns.clock_recency[i])
+            item._rank_score = None
+            self._push_rank(item)
+        columns.rescored[positions] = True
+        if len(self._rank_heap) > 2 * len(self.items) + 64:
+            self._rebuild_rank_heap()
+
+        if NUMBA_AVAILABLE:
+            order = _top_k_kernel(columns.recency, columns.relevance, columns.weight, positions, top_k)
+        else:
+            order = _top_k_indices(columns.scores(positions), top_k)
+        return [columns.items[positions[i]] for i in order]
+
+    def _memoized(self, key: tuple, compute):
+        """Return compute() cached under key until the store changes."""
+        if self._memo_version != self.version or len(self._memo) >= self._memo_maxsize:
+            self._memo.clear()
+            self._memo_version = self.version
+        if key not in self._memo:
+            self._memo[key] = compute()
+        return self._memo[key]
+
+    def retrieve_ranked_context_cached(
+        self,
+        query: Optional[str] = None,
+        top_k: int = 20,
+        importance_filter: Optional[ContextImportance] = None,
+        team_filter: Optional[str] = None,
+    ) -> List[ContextItem]:
+        """retrieve_ranked_context(), memoized until the next store change."""
+        return self._memoized(
+            ("ranked", query, top_k, importance_filter, team_filter),
+            lambda: self.retrieve_ranked_context(query, top_k, importance_filter, team_filter),
+        )
 
-        # Update recency scores
-        for item in filtered_items:
-            item.recency_score = self._calculate_recency_score(item.timestamp)
+    def get_state_summary(self, state_key: Optional[tuple] = None) -> str:
+        """
+        get_context_summary() for a game state signature, memoized until the
+        next store change.
 
-        # Sort by rank score
-        sorted_items = sorted(
-            filtered_items,
-            key=lambda x: x.get_rank_score(),
-            reverse=True
-        )
+        Args:
+            state_key: GameState.summary_key() tuple
+                (quarter, clock, home, away, down, distance, possession)
 
-        return sorted_items[:top_k]
+        Returns:
+            Formatted context string
+        """
+        def compute() -> str:
+            game_state = None
+            if state_key:
+                quarter, clock, home, away, down, distance, possession = state_key
+                game_state = {
+                    "quarter": quarter,
+                    "clock": clock,
+                    "score": {"home": home, "away": away},
+                    "down": down,
+                    "distance": distance,
+                    "possession": possession,
+                }
+            return self.get_context_summary(game_state=game_state)
+
+        return self._memoized(("summary", state_key), compute)
 
     def get_context_summary(self, game_state: Optional[Dict[str, Any]] = None) -> str:
         """
@@ -212,89 +520,137 @@ class RAGContextStore:
         top_items = self.retrieve_ranked_context(top_k=15)
 
         summary_parts = []
+        append = summary_parts.append
 
         # Add game state if provided
         if game_state:
-            summary_parts.append(f"Quarter: {game_state.get('quarter', 1)}")
-            summary_parts.append(f"Clock: {game_state.get('clock', '15:00')}")
             score = game_state.get('score', {})
-            summary_parts.append(f"Score: {score.get('home', 0)} - {score.get('away', 0)}")
-            summary_parts.append(f"Down/Distance: {game_state.get('down', 1)}/{game_state.get('distance', 10)}")
-            summary_parts.append(f"Possession: {game_state.get('possession', 'Team')}")
-            summary_parts.append("")
+            append(
+                f"Quarter: {game_state.get('quarter', 1)}\n"
+                f"Clock: {game_state.get('clock', '15:00')}\n"
+                f"Score: {score.get('home', 0)} - {score.get('away', 0)}\n"
+                f"Down/Distance: {game_state.get('down', 1)}/{game_state.get('distance', 10)}\n"
+                f"Possession: {game_state.get('possession', 'Team')}\n"
+            )
 
-        # Add context items
-        summary_parts.append("Recent Events:")
+        # Add context items, one entry (with its Player/Team lines) per item
+        append("Recent Events:")
         for item in top_items:
-            rank_score = item.get_rank_score()
-            summary_parts.append(
+            player = f"\n  Player: {item.player_name}" if item.player_name else ""
+            team = f"\n  Team: {item.team}" if item.team else ""
+            append(
                 f"[{item.timestamp}] {item.event_type.upper()} "
-                f"({item.importance.value}) - {item.description}"
+                f"({item.importance.label}) - {item.description}{player}{team}"
             )
-            if item.player_name:
-                summary_parts.append(f"  Player: {item.player_name}")
-            if item.team:
-                summary_parts.append(f"  Team: {item.team}")
 
         return "\n".join(summary_parts)
 
+    @staticmethod
     def _calculate_relevance_score(
-        self,
         event_type: str,
-        description: str,
-        query: Optional[str] = None,
+        description_lower: str = "",
+        query_lower: Optional[str] = None,
+        query_keywords: Sequence[str] = (),
     ) -> float:
-        """Calculate relevance score for an event."""
-        base_score = 0.5
+        """
+        Calculate relevance score for an event.
 
-        # Boost score based on event type importance
-        important_types = {
-            "pass": 0.7, "run": 0.7, "turnover": 0.9,
-            "scoring": 0.95, "sack": 0.8, "interception": 0.9,
-            "fumble": 0.9, "touchdown": 0.95, "field_goal": 0.85,
-        }
+        Args:
+            event_type: Event type
+            description_lower: Lowercased event description
+            query_lower: Lowercased query, if any
+            query_keywords: Query words longer than 3 characters
 
-        for event_key, score in important_types.items():
-            if event_key.lower() in event_type.lower():
-                base_score = score
-                break
+        Returns:
+            Relevance score (0-1)
+        """
+        # Boost score based on event type importance
+        base_score = _event_type_score(event_type)
 
         # Boost if query matches description
-        if query:
-            query_lower = query.lower()
-            description_lower = description.lower()
-
+        if query_lower:
             if query_lower in description_lower:
                 base_score = min(base_score + 0.3, 1.0)
 
             # Check for specific keywords
-            keywords = query_lower.split()
-            matches = sum(1 for kw in keywords if len(kw) > 3 and kw in description_lower)
+            matches = sum(1 for kw in query_keywords if kw in description_lower)
             base_score = min(base_score + (matches * 0.1), 1.0)
 
         return min(max(base_score, 0.0), 1.0)
 
-    def _calculate_recency_score(self, timestamp: str) -> float:
-        """Calculate recency score based on timestamp."""
-        try:
-            parts = timestamp.split(":")
-            minutes = int(parts[0])
-            seconds = int(parts[1]) if len(parts) > 1 else 0
-            total_seconds = minutes * 60 + seconds
-
-            # More recent = higher score
-            # 15:00 = ~900 seconds, so normalize
-            recency = 1.0 - (total_seconds / 900.0)
-            return min(max(recency, 0.0), 1.0)
-        except:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _query_relevance(event_type: str, description_lower: str, query_lower: str) -> float:
+        """
+        _calculate_relevance_score() for a query, cached across retrievals so
+        repeated queries (dashboard polling) skip the substring scans.
+        """
+        query_keywords = [kw for kw in query_lower.split() if len(kw) > 3]
+        return RAGContextStore._calculate_relevance_score(
+            event_type, description_lower, query_lower, query_keywords
+        )
+
+    def _calculate_recency_score(self, total_seconds: Optional[int]) -> float:
+        """Calculate recency score from a parsed game clock."""
+        if total_seconds is None:
             return 0.5
 
-    def _compress_context(self) -> None:
+        # More recent = higher score
+        # 15:00 = ~900 seconds, so normalize
+        recency = 1.0 - (total_seconds / 900.0)
+        return min(max(recency, 0.0), 1.0)
+
+    def _index(self, item: ContextItem) -> None:
+        """Append an item to the scoring columns."""
+        self._columns.append(item, self._calculate_recency_score(item.total_seconds))
+
+    def _reindex(self) -> None:
+        """Rebuild the scoring columns and rank heap from self.items."""
+        self._columns.clear()
+        for item in self.items.values():
+            self._index(item)
+        self._rebuild_rank_heap()
+
+    def _push_rank(self, item: ContextItem) -> None:
+        """Record an item's current rank score in the eviction heap."""
+        heapq.heappush(self._rank_heap, (item.get_rank_score(), -item._seq, item.id))
+
+    def _rebuild_rank_heap(self) -> None:
+        """Drop stale heap entries, keeping one per item."""
+        self._rank_heap = [
+            (item.get_rank_score(), -item._seq, item.id) for item in self.items.values()
+        ]
+        heapq.heapify(self._rank_heap)
+
+    def _evict_lowest(self) -> None:
+        """
+        Remove the lowest-ranked item (the newest one among equal scores).
+
+        Amortized O(log n): stale heap entries for removed or rescored items
+        are discarded as they surface, since every score change pushes a
+        fresh entry.
+        """
+        while self._rank_heap:
+            score, _, item_id = heapq.heappop(self._rank_heap)
+            item = self.items.get(item_id)
+            if item is None or item.get_rank_score() != score:
+                continue
+            del self.items[item_id]
+            self._columns.remove(item_id)
+            if self._columns.dead > len(self.items):
+                self._reindex()
+            self.version += 1
+            logger.debug("Evicted context item: %s", item_id)
+            return
+
+    def compress_context(self) -> None:
         """
         Compress context by removing low-ranking items.
-        Keeps top items and aggregates older data.
+        Keeps the top 60% of items by rank. The store already stays within
+        max_items by evicting one item per add, so this is only needed to
+        shrink it further on demand.
         """
-        logger.info(f"Compressing context store (current size: {len(self.items)})")
+        logger.info("Compressing context store (current size: %d)", len(self.items))
 
         # Get all items sorted by rank
         all_items = sorted(
@@ -315,22 +671,25 @@ class RAGContextStore:
 
         for item_id in removed_ids:
             del self.items[item_id]
+        self._reindex()
+        self.version += 1
 
         self.last_compression_time = datetime.now()
-        logger.info(f"Removed {len(removed_ids)} low-ranking items. New size: {len(self.items)}")
+        logger.info("Removed %d low-ranking items. New size: %d", len(removed_ids), len(self.items))
 
     def clear(self) -> None:
         """Clear all context items."""
         self.items.clear()
+        self._columns.clear()
+        self._rank_heap = []
         self.event_counter = 0
+        self.version += 1
         logger.info("Context store cleared")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get statistics about the context store."""
-        items_by_importance = {}
-        for item in self.items.values():
-            importance = item.importance.value
-            items_by_importance[importance] = items_by_importance.get(importance, 0) + 1
+        counts = Counter(item.importance for item in self.items.values())
+        items_by_importance = {importance.label: count for importance, count in counts.items()}
 
         return {
             "total_items": len(self.items),
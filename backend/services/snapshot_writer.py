@@ -0,0 +1,183 @@
+"""
+Simulation Snapshot Writer
+
+Buffers simulation snapshots in memory and flushes them to the database in
+batches. On PostgreSQL the batch is streamed with COPY, which is much cheaper
+than per-row INSERTs for the fat player_positions JSON payload.
+"""
+
+import asyncio
+import csv
+import io
+import json
+import uuid
+from typing import Optional, Dict, Any, List
+
+from sqlalchemy import insert
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from database.connection import engine
+from database.models import SimulationSnapshot
+from utils.logger import logger
+
+# Column order used for COPY and for building rows
+SNAPSHOT_COLUMNS = (
+    "id",
+    "match_id",
+    "timestamp",
+    "play_cycle",
+    "sim_seconds_remaining",
+    "quarter",
+    "clock",
+    "score_home",
+    "score_away",
+    "down",
+    "distance",
+    "possession",
+    "line_of_scrimmage_y",
+    "player_positions",
+    "ball_x",
+    "ball_y",
+)
+
+# Scalar column defaults, applied to fields the caller omits
+_COLUMN_DEFAULTS = {
+    column.key: column.default.arg
+    for column in SimulationSnapshot.__table__.columns
+    if column.default is not None and column.default.is_scalar
+}
+
+_COPY_SQL = f"COPY simulation_snapshots ({', '.join(SNAPSHOT_COLUMNS)}) FROM STDIN"
+
+
+def _dump_json(value: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Serialize a JSON column value for COPY."""
+    if value is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+class SnapshotWriter:
+    """Queues simulation snapshots and writes them in periodic batches."""
+
+    def __init__(self, flush_interval: float = 0.1, max_batch: int = 500):
+        """
+        Initialize the snapshot writer.
+
+        Args:
+            flush_interval: Seconds between batch flushes
+            max_batch: Maximum snapshots written per flush
+        """
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+        logger.info("Simulation snapshot writer started")
+
+    async def stop(self) -> None:
+        """Stop the flush task and write anything still queued."""
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self._flush()
+        logger.info("Simulation snapshot writer stopped")
+
+    def enqueue(self, match_id: str, **fields: Any) -> SimulationSnapshot:
+        """
+        Queue a snapshot for the next batch.
+
+        Returns a transient SimulationSnapshot carrying the generated id so
+        callers can serialize it without waiting for the write.
+        """
+        if not self.is_running:
+            self.start()
+
+        row = {
+            column: fields.get(column, _COLUMN_DEFAULTS.get(column))
+            for column in SNAPSHOT_COLUMNS
+        }
+        row["id"] = str(uuid.uuid4())
+        row["match_id"] = match_id
+        self._queue.put_nowait(row)
+        return SimulationSnapshot(**row)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self._flush()
+
+    async def _flush(self) -> None:
+        """Drain the queue and write batches off the event loop."""
+        while self._queue is not None and not self._queue.empty():
+            batch: List[Dict[str, Any]] = []
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception as e:
+                logger.error(f"Failed to write {len(batch)} simulation snapshots: {e}")
+
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """Write a batch using COPY on PostgreSQL, bulk INSERT elsewhere."""
+        dialect = engine.dialect
+        if dialect.name == "postgresql" and dialect.driver in ("psycopg2", "psycopg"):
+            self._copy_batch(batch, dialect.driver)
+        else:
+            with engine.begin() as conn:
+                conn.execute(insert(SimulationSnapshot), batch)
+
+    def _copy_batch(self, batch: List[Dict[str, Any]], driver: str) -> None:
+        """Stream a batch into simulation_snapshots with COPY."""
+        rows = [
+            tuple(
+                _dump_json(row[column]) if column == "player_positions" else row[column]
+                for column in SNAPSHOT_COLUMNS
+            )
+            for row in batch
+        ]
+
+        raw_conn = engine.raw_connection()
+        try:
+            cursor = raw_conn.cursor()
+            if driver == "psycopg":
+                with cursor.copy(_COPY_SQL) as copy:
+                    for row in rows:
+                        copy.write_row(row)
+            else:
+                # psycopg2 has no row writer; feed CSV (None -> NULL)
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                buffer.seek(0)
+                cursor.copy_expert(f"{_COPY_SQL} WITH (FORMAT csv)", buffer)
+            raw_conn.commit()
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+
+# Global singleton instance
+snapshot_writer = SnapshotWriter()
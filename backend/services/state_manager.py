@@ -1,13 +1,28 @@
 import asyncio
+import inspect
+import weakref
 from typing import Callable, Optional, Coroutine, Any
 from models.schemas import GameState, ScoreState
 from utils.logger import logger
 
 
 class StateManager:
-    """Manages game state and notifies subscribers of changes."""
+    """
+    Manages game state and notifies subscribers of changes.
 
-    def __init__(self):
+    Updates only swap the state and mark it dirty; a background task
+    broadcasts the latest state once per coalescing window, so a burst of
+    updates during one play costs a single fan-out.
+    """
+
+    def __init__(self, coalesce_window: float = 0.016):
+        """
+        Initialize the state manager.
+
+        Args:
+            coalesce_window: Seconds to collect updates before broadcasting
+        """
+        self.coalesce_window = coalesce_window
         self._state = GameState(
             clock="15:00",
             quarter=1,
@@ -21,49 +36,116 @@ class StateManager:
             defensiveStopRate=50.0,
             engagement="0",
         )
-        self._subscribers: list[Callable[[GameState], Coroutine[Any, Any, None]]] = []
-        self._lock = asyncio.Lock()
+        # Weak references to subscriber callbacks (dict used as an ordered
+        # set); dead entries remove themselves when the callback is collected
+        self._subscribers: dict[weakref.ref, None] = {}
+        self._dirty: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
 
     @property
     def state(self) -> GameState:
         """Get current game state."""
         return self._state
 
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start the background broadcast task on the running event loop."""
+        if self.is_running:
+            return
+        self._dirty = asyncio.Event()
+        self._task = asyncio.create_task(self._broadcast_loop())
+        logger.debug("State broadcast loop started")
+
+    async def stop(self) -> None:
+        """Stop the broadcast task and deliver any pending update."""
+        if not self.is_running:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._dirty.is_set():
+            self._dirty.clear()
+            await self._notify_subscribers(self._state)
+
+    def _ref(self, callback: Callable, on_dead: Optional[Callable] = None) -> weakref.ref:
+        """Weak reference to a callback; bound methods need WeakMethod."""
+        if inspect.ismethod(callback):
+            return weakref.WeakMethod(callback, on_dead)
+        return weakref.ref(callback, on_dead)
+
+    def _discard(self, ref: weakref.ref) -> None:
+        self._subscribers.pop(ref, None)
+
     def subscribe(self, callback: Callable[[GameState], Coroutine[Any, Any, None]]) -> None:
-        """Subscribe to state changes."""
-        self._subscribers.append(callback)
-        logger.debug(f"New subscriber added. Total: {len(self._subscribers)}")
+        """
+        Subscribe to state changes.
+
+        Callbacks are held weakly, so a subscriber is dropped automatically
+        once nothing else references it; keep a reference while subscribed.
+        """
+        self._subscribers[self._ref(callback, self._discard)] = None
+        logger.debug("New subscriber added. Total: %d", len(self._subscribers))
 
     def unsubscribe(self, callback: Callable[[GameState], Coroutine[Any, Any, None]]) -> None:
         """Unsubscribe from state changes."""
-        if callback in self._subscribers:
-            self._subscribers.remove(callback)
-            logger.debug(f"Subscriber removed. Total: {len(self._subscribers)}")
-
-    async def _notify_subscribers(self) -> None:
-        """Notify all subscribers of state change."""
-        for callback in self._subscribers:
-            try:
-                await callback(self._state)
-            except Exception as e:
-                logger.error(f"Failed to notify subscriber: {e}")
+        if self._subscribers.pop(self._ref(callback), 0) is None:
+            logger.debug("Subscriber removed. Total: %d", len(self._subscribers))
+
+    def _publish(self, state: GameState) -> None:
+        """
+        Make state the current state and schedule a broadcast.
+
+        GameState is frozen, so updates build a new object and swap the
+        reference; the published object doubles as the subscribers' snapshot.
+        Callers derive the new state and publish it without awaiting in
+        between, which keeps the read-modify-write atomic on the event loop.
+        """
+        self._state = state
+        if not self.is_running:
+            self.start()
+        self._dirty.set()
+
+    async def _broadcast_loop(self) -> None:
+        while True:
+            await self._dirty.wait()
+            await asyncio.sleep(self.coalesce_window)
+            self._dirty.clear()
+            await self._notify_subscribers(self._state)
+
+    async def _notify_subscribers(self, state: GameState) -> None:
+        """Notify all subscribers of a state change concurrently."""
+        subscribers = [callback for callback in (ref() for ref in list(self._subscribers)) if callback]
+        results = await asyncio.gather(
+            *(callback(state) for callback in subscribers),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Failed to notify subscriber: {result}")
 
     async def update_score(self, home: Optional[int] = None, away: Optional[int] = None) -> None:
         """Update game score."""
-        async with self._lock:
-            if home is not None:
-                self._state.score.home = home
-            if away is not None:
-                self._state.score.away = away
-            await self._notify_subscribers()
+        score: dict[str, Any] = {}
+        if home is not None:
+            score["home"] = home
+        if away is not None:
+            score["away"] = away
+        self._publish(
+            self._state.model_copy(update={"score": self._state.score.model_copy(update=score)})
+        )
 
     async def update_clock(self, clock: str, quarter: Optional[int] = None) -> None:
         """Update game clock and optionally quarter."""
-        async with self._lock:
-            self._state.clock = clock
-            if quarter is not None:
-                self._state.quarter = quarter
-            await self._notify_subscribers()
+        changes: dict[str, Any] = {"clock": clock}
+        if quarter is not None:
+            changes["quarter"] = quarter
+        self._publish(self._state.model_copy(update=changes))
 
     async def update_possession(
         self,
@@ -72,13 +154,12 @@ class StateManager:
         distance: Optional[int] = None,
     ) -> None:
         """Update possession and down/distance."""
-        async with self._lock:
-            self._state.possession = possession
-            if down is not None:
-                self._state.down = down
-            if distance is not None:
-                self._state.distance = distance
-            await self._notify_subscribers()
+        changes: dict[str, Any] = {"possession": possession}
+        if down is not None:
+            changes["down"] = down
+        if distance is not None:
+            changes["distance"] = distance
+        self._publish(self._state.model_copy(update=changes))
 
     async def update_play(
         self,
@@ -87,19 +168,16 @@ class StateManager:
         epa: Optional[float] = None,
     ) -> None:
         """Update last play description and analytics."""
-        async with self._lock:
-            self._state.lastPlay = last_play
-            if win_prob is not None:
-                self._state.winProb = win_prob
-            if epa is not None:
-                self._state.offensiveEpa = epa
-            await self._notify_subscribers()
+        changes: dict[str, Any] = {"lastPlay": last_play}
+        if win_prob is not None:
+            changes["winProb"] = win_prob
+        if epa is not None:
+            changes["offensiveEpa"] = epa
+        self._publish(self._state.model_copy(update=changes))
 
     async def set_state(self, state: GameState) -> None:
         """Set complete game state."""
-        async with self._lock:
-            self._state = state
-            await self._notify_subscribers()
+        self._publish(state)
 
     def reset(self) -> None:
         """Reset to initial state."""
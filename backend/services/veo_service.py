@@ -4,6 +4,12 @@ from typing import Optional
 from config import settings
 from utils.logger import logger
 
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 class VeoService:
     """Service for Veo 3.1 video generation from reference images."""
@@ -12,6 +18,7 @@ class VeoService:
         self._api_key = None
         self._model_id = "fal-ai/veo3.1/reference-to-video"
         self._base_url = "https://fal.run"
+        self._client: Optional[httpx.AsyncClient] = None
         self._initialized = False
 
     def initialize(self) -> bool:
@@ -25,6 +32,16 @@ class VeoService:
             return False
 
         try:
+            # One client for all requests keeps the TLS connection alive
+            self._client = httpx.AsyncClient(
+                timeout=600.0,
+                http2=HTTP2_AVAILABLE,
+                headers={
+                    "Authorization": f"Key {self._api_key}",
+                    "Content-Type": "application/json",
+                },
+                limits=httpx.Limits(max_keepalive_connections=10),
+            )
             self._initialized = True
             logger.info("Veo 3.1 API initialized successfully")
             return True
@@ -32,6 +49,13 @@ class VeoService:
             logger.error(f"Failed to initialize Veo: {e}")
             return False
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        self._initialized = False
+
     async def generate_video_from_images(
         self,
         prompt: str,
@@ -80,34 +104,28 @@ class VeoService:
         }
 
         try:
-            headers = {
-                "Authorization": f"Key {self._api_key}",
-                "Content-Type": "application/json",
+            logger.info("Requesting video generation with prompt: %.50s...", prompt)
+            response = await self._client.post(
+                f"{self._base_url}/{self._model_id}",
+                json=payload,
+            )
+            response.raise_for_status()
+            result = response.json()
+
+            video_url = (result.get("video") or {}).get("url")
+            logger.info("Video generated successfully: %s", video_url or "N/A")
+            return {
+                "video_url": video_url,
+                "status": "completed",
+                "prompt": prompt,
+                "image_count": len(image_urls),
             }
 
-            async with httpx.AsyncClient(timeout=600.0) as client:
-                logger.info(f"Requesting video generation with prompt: {prompt[:50]}...")
-                response = await client.post(
-                    f"{self._base_url}/{self._model_id}",
-                    json=payload,
-                    headers=headers,
-                )
-
-                if response.status_code == 200:
-                    result = response.json()
-                    logger.info(f"Video generated successfully: {result.get('video', {}).get('url', 'N/A')}")
-                    return {
-                        "video_url": result.get("video", {}).get("url"),
-                        "status": "completed",
-                        "prompt": prompt,
-                        "image_count": len(image_urls),
-                    }
-                else:
-                    logger.error(
-                        f"Video generation failed with status {response.status_code}: {response.text}"
-                    )
-                    return None
-
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                f"Video generation failed with status {e.response.status_code}: {e.response.text[:512]}"
+            )
+            return None
         except httpx.TimeoutException:
             logger.error("Video generation request timed out")
             return None
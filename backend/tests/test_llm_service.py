@@ -0,0 +1,44 @@
+import unittest
+
+from config import settings
+from services.llm_service import LLMService
+
+
+class ParseAnalysisResponseTest(unittest.TestCase):
+    """LLMService._parse_analysis_response field extraction."""
+
+    def setUp(self):
+        self.service = LLMService()
+        self.threshold = settings.CONFIDENCE_THRESHOLD
+
+    def test_fields_on_separate_lines(self):
+        results = self.service._parse_analysis_response(
+            "EVENT: Run\nDETAILS: off tackle\nCONFIDENCE: 0.85\n---\nEVENT: Sack\nCONFIDENCE: .95",
+            "12:00",
+        )
+        self.assertEqual(
+            [(r.event, r.details, r.confidence) for r in results],
+            [("Run", "off tackle", 0.85), ("Sack", "No details available", 0.95)],
+        )
+
+    def test_fields_on_single_line(self):
+        results = self.service._parse_analysis_response(
+            "EVENT: Pass DETAILS: deep ball CONFIDENCE: 0.9", "12:00"
+        )
+        self.assertEqual(
+            [(r.event, r.details, r.confidence) for r in results],
+            [("Pass", "deep ball", 0.9)],
+        )
+
+    def test_single_line_confidence_below_threshold_is_dropped(self):
+        settings.CONFIDENCE_THRESHOLD = 0.5
+        self.addCleanup(setattr, settings, "CONFIDENCE_THRESHOLD", self.threshold)
+
+        results = self.service._parse_analysis_response(
+            "EVENT: Pass DETAILS: deep CONFIDENCE: 0.3", "12:00"
+        )
+        self.assertEqual([r.event for r in results], ["Frame Captured"])
+
+
+if __name__ == "__main__":
+    unittest.main()
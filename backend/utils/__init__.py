@@ -1,3 +1,4 @@
 from .logger import logger, setup_logger
+from .json_extract import extract_json_object, loads_json, dumps_json
 
-__all__ = ["logger", "setup_logger"]
+__all__ = ["logger", "setup_logger", "extract_json_object", "loads_json", "dumps_json"]
@@ -0,0 +1,52 @@
+"""
+Image parts for Gemini requests.
+
+Gemini accepts inline JPEG bytes as {"mime_type": "image/jpeg", "data": ...}.
+Encoding a frame once and passing that part around avoids the SDK
+re-encoding a PIL image on every request and retry.
+"""
+
+import io
+from typing import Any, Dict, Union
+
+import cv2
+import numpy as np
+from PIL import Image
+
+JPEG_QUALITY = 80
+
+ImageInput = Union[Image.Image, bytes, Dict[str, Any]]
+
+
+def encode_jpeg(image: Image.Image, quality: int = JPEG_QUALITY) -> bytes:
+    """Encode a PIL image as JPEG bytes."""
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=quality)
+    return buffer.getvalue()
+
+
+def encode_jpeg_bgr(frame: np.ndarray, quality: int = JPEG_QUALITY) -> bytes:
+    """Encode an OpenCV BGR frame as JPEG bytes without a PIL round trip."""
+    ok, encoded = cv2.imencode(".jpg", frame, [cv2.IMWRITE_JPEG_QUALITY, quality])
+    if not ok:
+        raise ValueError("JPEG encoding failed")
+    return encoded.tobytes()
+
+
+def jpeg_part(image: ImageInput) -> Dict[str, Any]:
+    """
+    Build an inline image part for generate_content.
+
+    Args:
+        image: PIL image, JPEG bytes, or an existing part (returned as-is)
+
+    Returns:
+        {"mime_type": "image/jpeg", "data": jpeg_bytes}
+    """
+    if isinstance(image, dict):
+        return image
+    if isinstance(image, Image.Image):
+        image = encode_jpeg(image)
+    return {"mime_type": "image/jpeg", "data": image}
@@ -0,0 +1,56 @@
+import json
+from typing import Any, Optional
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def extract_json_object(text: str) -> Optional[str]:
+    """
+    Return the first balanced {...} object embedded in text.
+
+    Walks the string once tracking brace depth, ignoring braces inside
+    string literals, so there is no regex backtracking over long LLM output.
+    """
+    start = text.find("{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return None
+
+
+def loads_json(data: str) -> Any:
+    """Parse JSON with orjson when available, falling back to the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(data: Any, indent: bool = False) -> str:
+    """Serialize to a JSON string with orjson when available (2-space indent)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(data, indent=2 if indent else None)
@@ -1,10 +1,18 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from config import settings
 
 
 def setup_logger(name: str = "superbowl") -> logging.Logger:
-    """Set up and return a configured logger."""
+    """
+    Set up and return a configured logger.
+
+    Records are queued by the calling thread and written to stdout by a
+    background listener, so logging never blocks on terminal I/O.
+    """
     log = logging.getLogger(name)
 
     if log.handlers:
@@ -21,7 +29,12 @@ def setup_logger(name: str = "superbowl") -> logging.Logger:
         datefmt="%Y-%m-%d %H:%M:%S",
     )
     handler.setFormatter(formatter)
-    log.addHandler(handler)
+
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    log.addHandler(QueueHandler(records))
 
     return log
 